@@ -1,41 +1,53 @@
 #!/usr/bin/env python3
 """Check version compatibility across workspace packages."""
 
+import re
 import sys
 from pathlib import Path
 import tomllib
 
-def get_version(pyproject_path):
-    """Extract version from pyproject.toml."""
-    with open(pyproject_path, "rb") as f:
-        data = tomllib.load(f)
-        return data["project"]["version"]
+# Scoped to the [project] table: everything up to the next table header
+_PROJECT_TABLE = re.compile(rb"^\[project\][ \t]*$(.*?)(?=^\[|\Z)", re.M | re.S)
+_VERSION = re.compile(rb'^version\s*=\s*"([^"]+)"', re.M)
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_PACKAGES = {
+    "core": _REPO_ROOT / "packages/core/pyproject.toml",
+    "cli": _REPO_ROOT / "packages/cli/pyproject.toml",
+}
 
-def parse_version(version):
-    """Parse version string into (major, minor, patch)."""
-    parts = version.split(".")
-    return tuple(int(p) for p in parts)
+def get_version(pyproject_path):
+    """Extract version from pyproject.toml, or None if the file is missing."""
+    try:
+        with open(pyproject_path, "rb", buffering=0) as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+
+    # Fast path: read the static [project].version without a full TOML parse
+    table = _PROJECT_TABLE.search(data)
+    if table:
+        match = _VERSION.search(table.group(1))
+        if match:
+            return match.group(1).decode()
+
+    return tomllib.loads(data.decode())["project"]["version"]
+
+def parse_major(version):
+    """Parse only the major component of a version string."""
+    return int(version[:version.index(".")])
 
 def check_compatibility():
     """Check if all packages have compatible versions."""
-    root = Path(__file__).parent.parent.parent
-
-    packages = {
-        "core": root / "packages/core/pyproject.toml",
-        "cli": root / "packages/cli/pyproject.toml",
-    }
-
     versions = {}
-    for name, path in packages.items():
-        if path.exists():
-            versions[name] = get_version(path)
-            print(f"{name:10} {versions[name]}")
+    for name, path in _PACKAGES.items():
+        version = get_version(path)
+        if version is not None:
+            versions[name] = version
+            print(f"{name:10} {version}")
 
     # Check major versions
-    major_versions = set()
-    for name, version in versions.items():
-        major, _, _ = parse_version(version)
-        major_versions.add(major)
+    major_versions = {parse_major(version) for version in versions.values()}
     
     if len(major_versions) > 1:
         print("\n⚠️  WARNING: Packages have different major versions!")
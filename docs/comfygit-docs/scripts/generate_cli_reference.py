@@ -4,213 +4,242 @@
 This script extracts command structure from the CLI and generates markdown
 documentation for each command category defined in mkdocs.yml.
 """
+import argparse
 import sys
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, Final, NamedTuple
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_CLI_PATH = _SCRIPT_DIR.parents[2] / "packages" / "cli"
+_OUT_DIR = _SCRIPT_DIR.parent / "docs" / "cli-reference"
 
 # Add CLI package to path
-cli_path = Path(__file__).parent.parent.parent.parent / "packages" / "cli"
-sys.path.insert(0, str(cli_path))
+sys.path.insert(0, str(_CLI_PATH))
 
 from comfygit_cli.cli import create_parser
 
 
-def get_subcommand_help(parser, command_name: str) -> dict[str, Any]:
-    """Extract help information for a subcommand."""
-    # Find the subparser
+def build_command_index(parser) -> dict[str, Any]:
+    """Map each subcommand name of a parser to its subparser."""
     for action in parser._actions:
-        if hasattr(action, 'choices') and action.choices and command_name in action.choices:
-            subparser = action.choices[command_name]
-
-            result = {
-                'name': command_name,
-                'description': subparser.description or '',
-                'usage': subparser.format_usage().replace('usage: ', ''),
-                'arguments': [],
-                'options': [],
-                'subcommands': {}
-            }
+        if isinstance(action.choices, dict):
+            return action.choices
+    return {}
 
-            # Extract arguments and options
-            for sub_action in subparser._actions:
-                if sub_action.dest == 'help':
-                    continue
-
-                option_strings = sub_action.option_strings
-                if option_strings:
-                    # This is an option
-                    result['options'].append({
-                        'flags': ', '.join(option_strings),
-                        'dest': sub_action.dest,
-                        'help': sub_action.help or '',
-                        'default': sub_action.default if sub_action.default != '==SUPPRESS==' else None,
-                        'choices': sub_action.choices if hasattr(sub_action, 'choices') and not isinstance(sub_action.choices, dict) else None,
-                        'required': getattr(sub_action, 'required', False),
-                    })
-                elif sub_action.dest not in ['command', 'func'] and hasattr(sub_action, 'choices') and isinstance(sub_action.choices, dict):
-                    # This is a subcommand group
-                    result['subcommands'] = {
-                        name: get_subcommand_help(subparser, name)
-                        for name in sub_action.choices.keys()
-                    }
-                else:
-                    # This is a positional argument
-                    if sub_action.dest not in ['command', 'func']:
-                        result['arguments'].append({
-                            'name': sub_action.dest,
-                            'help': sub_action.help or '',
-                            'nargs': sub_action.nargs,
-                            'default': sub_action.default if sub_action.default != '==SUPPRESS==' else None,
-                        })
-
-            return result
 
-    return {}
+class Opt(NamedTuple):
+    """An option (flagged argument) of a command."""
+    flags: str
+    dest: str
+    help: str
+    default: Any
+    choices: Any
+    required: bool
 
 
-def format_option(opt: dict[str, Any]) -> str:
-    """Format an option for markdown."""
-    parts = [f"- `{opt['flags']}`"]
+class Arg(NamedTuple):
+    """A positional argument of a command."""
+    name: str
+    help: str
+    nargs: Any
+    default: Any
 
-    if opt['help']:
-        parts.append(f" - {opt['help']}")
 
-    if opt['choices']:
-        parts.append(f" (choices: {', '.join(f'`{c}`' for c in opt['choices'])})")
+def _default_of(action: argparse.Action) -> Any:
+    """Return an action's default, or None when argparse suppresses it."""
+    default = action.default
+    return None if default is argparse.SUPPRESS else default
 
-    if opt['required']:
-        parts.append(" **[required]**")
 
-    if opt['default'] is not None:
-        parts.append(f" (default: `{opt['default']}`)")
+# Parser bookkeeping dests that are not user-facing arguments
+_SKIP_DESTS: Final = frozenset(('command', 'func'))
 
-    return ''.join(parts)
 
+def get_subcommand_help(command_name: str, subparser) -> dict[str, Any]:
+    """Extract help information for a subcommand."""
+    result = {
+        'name': command_name,
+        'description': subparser.description or '',
+        'usage': subparser.format_usage().replace('usage: ', ''),
+        'arguments': [],
+        'options': [],
+        'subcommands': {}
+    }
 
-def format_argument(arg: dict[str, Any]) -> str:
-    """Format an argument for markdown."""
-    parts = [f"- `{arg['name']}`"]
+    # Extract arguments and options
+    for sub_action in subparser._actions:
+        dest = sub_action.dest
+        if dest == 'help':
+            continue
 
-    if arg['help']:
-        parts.append(f" - {arg['help']}")
+        choices = sub_action.choices
+        option_strings = sub_action.option_strings
+        if option_strings:
+            # This is an option
+            result['options'].append(Opt(
+                flags=', '.join(option_strings),
+                dest=dest,
+                help=sub_action.help or '',
+                default=_default_of(sub_action),
+                choices=choices if not isinstance(choices, dict) else None,
+                required=sub_action.required,
+            ))
+        elif dest in _SKIP_DESTS:
+            continue
+        elif isinstance(choices, dict):
+            # This is a subcommand group
+            result['subcommands'] = {
+                name: get_subcommand_help(name, nested)
+                for name, nested in choices.items()
+            }
+        else:
+            # This is a positional argument
+            result['arguments'].append(Arg(
+                name=dest,
+                help=sub_action.help or '',
+                nargs=sub_action.nargs,
+                default=_default_of(sub_action),
+            ))
 
-    if arg['nargs'] in ['*', '+']:
-        parts.append(" (multiple values allowed)")
-    elif arg['nargs'] == '?':
-        parts.append(" (optional)")
+    return result
 
-    if arg['default'] is not None:
-        parts.append(f" (default: `{arg['default']}`)")
 
-    return ''.join(parts)
+def format_option(opt: Opt) -> str:
+    """Format an option for markdown."""
+    help_text = f" - {opt.help}" if opt.help else ""
+    choices = f" (choices: {', '.join(f'`{c}`' for c in opt.choices)})" if opt.choices else ""
+    required = " **[required]**" if opt.required else ""
+    default = f" (default: `{opt.default}`)" if opt.default is not None else ""
+    return f"- `{opt.flags}`{help_text}{choices}{required}{default}"
 
 
-def generate_command_section(cmd_info: dict[str, Any], level: int = 2) -> list[str]:
-    """Generate markdown for a command section."""
-    lines = []
+def format_argument(arg: Arg) -> str:
+    """Format an argument for markdown."""
+    nargs = arg.nargs
+    help_text = f" - {arg.help}" if arg.help else ""
+    if nargs == '*' or nargs == '+':
+        multiplicity = " (multiple values allowed)"
+    elif nargs == '?':
+        multiplicity = " (optional)"
+    else:
+        multiplicity = ""
+    default = f" (default: `{arg.default}`)" if arg.default is not None else ""
+    return f"- `{arg.name}`{help_text}{multiplicity}{default}"
+
+
+def generate_command_section(cmd_info: dict[str, Any], level: int = 2) -> Iterator[str]:
+    """Generate markdown lines for a command section."""
     heading = '#' * level
 
     # Command heading
-    lines.append(f"\n{heading} `{cmd_info['name']}`\n")
+    yield f"\n{heading} `{cmd_info['name']}`\n"
 
     # Description
     if cmd_info['description']:
-        lines.append(f"{cmd_info['description']}\n")
+        yield f"{cmd_info['description']}\n"
 
     # Usage
-    lines.append("**Usage:**\n")
-    lines.append("```bash")
-    lines.append(cmd_info['usage'].strip())
-    lines.append("```\n")
+    yield "**Usage:**\n"
+    yield "```bash"
+    yield cmd_info['usage'].strip()
+    yield "```\n"
 
     # Arguments
     if cmd_info['arguments']:
-        lines.append("**Arguments:**\n")
+        yield "**Arguments:**\n"
         for arg in cmd_info['arguments']:
-            lines.append(format_argument(arg))
-        lines.append("")
+            yield format_argument(arg)
+        yield ""
 
     # Options
     if cmd_info['options']:
-        lines.append("**Options:**\n")
+        yield "**Options:**\n"
         for opt in cmd_info['options']:
-            lines.append(format_option(opt))
-        lines.append("")
+            yield format_option(opt)
+        yield ""
 
     # Subcommands
     if cmd_info['subcommands']:
-        lines.append(f"{heading}# Subcommands\n")
+        yield f"{heading}# Subcommands\n"
         for subcmd_name, subcmd_info in cmd_info['subcommands'].items():
-            lines.extend(generate_command_section(subcmd_info, level + 1))
-
-    return lines
+            yield from generate_command_section(subcmd_info, level + 1)
 
 
-def categorize_commands(parser) -> dict[str, list[str]]:
-    """Categorize commands into documentation sections."""
-    categories = {
-        'global-commands': ['init', 'list', 'import', 'export', 'model', 'registry', 'config', 'debug'],
-        'environment-commands': ['create', 'use', 'delete', 'run', 'status', 'manifest', 'repair', 'log', 'commit', 'rollback', 'pull', 'push', 'remote', 'py', 'constraint'],
-        'node-commands': ['node'],
-        'workflow-commands': ['workflow'],
-        'model-commands': ['model'],
-    }
+# Documentation page -> top-level commands it covers
+_CATEGORIES: Final[dict[str, tuple[str, ...]]] = {
+    'global-commands': ('init', 'list', 'import', 'export', 'model', 'registry', 'config', 'debug'),
+    'environment-commands': ('create', 'use', 'delete', 'run', 'status', 'manifest', 'repair', 'log', 'commit', 'rollback', 'pull', 'push', 'remote', 'py', 'constraint'),
+    'node-commands': ('node',),
+    'workflow-commands': ('workflow',),
+}
 
-    return categories
+_CATEGORY_DESCRIPTIONS: Final[dict[str, str]] = {
+    'global-commands': 'Workspace-level commands that operate on the entire ComfyDock workspace.',
+    'environment-commands': 'Commands for managing and operating within ComfyUI environments.',
+    'node-commands': 'Commands for managing custom nodes within an environment.',
+    'workflow-commands': 'Commands for managing and resolving workflow dependencies.',
+}
 
 
-def generate_category_page(category_name: str, commands: list[str], parser) -> str:
-    """Generate a complete markdown page for a command category."""
-    lines = []
+def generate_category_page(
+    category_name: str, commands: tuple[str, ...], cmd_index: dict[str, Any]
+) -> Iterator[str]:
+    """Generate the markdown lines of a page for a command category.
 
+    cmd_index maps top-level command names to their subparsers (see
+    build_command_index).
+    """
     # Page title
     title = category_name.replace('-', ' ').title()
-    lines.append(f"# {title}\n")
+    yield f"# {title}\n"
 
     # Category description
-    descriptions = {
-        'global-commands': 'Workspace-level commands that operate on the entire ComfyDock workspace.',
-        'environment-commands': 'Commands for managing and operating within ComfyUI environments.',
-        'node-commands': 'Commands for managing custom nodes within an environment.',
-        'workflow-commands': 'Commands for managing and resolving workflow dependencies.',
-        'model-commands': 'Commands for managing the global model index and downloading models.',
-    }
-
-    if category_name in descriptions:
-        lines.append(f"> {descriptions[category_name]}\n")
+    description = _CATEGORY_DESCRIPTIONS.get(category_name)
+    if description:
+        yield f"> {description}\n"
 
     # Generate documentation for each command
     for cmd_name in commands:
-        cmd_info = get_subcommand_help(parser, cmd_name)
-        if cmd_info:
-            lines.extend(generate_command_section(cmd_info, level=2))
+        subparser = cmd_index.get(cmd_name)
+        if subparser is not None:
+            yield from generate_command_section(get_subcommand_help(cmd_name, subparser), level=2)
 
-    return '\n'.join(lines)
+
+def write_if_changed(output_file: Path, lines: Iterator[str]) -> bool:
+    """Write newline-separated lines to a file unless it already has them.
+
+    Leaving unchanged pages untouched keeps their mtime, so docs builds don't
+    rebuild them. Returns True if the file was written.
+    """
+    content = '\n'.join(lines).encode()
+    try:
+        if output_file.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    output_file.write_bytes(content)
+    return True
 
 
 def main():
     """Generate CLI reference documentation."""
     # Create output directory
-    output_dir = Path(__file__).parent.parent / "docs" / "cli-reference"
+    output_dir = _OUT_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Get parser
-    parser = create_parser()
-
-    # Categorize commands
-    categories = categorize_commands(parser)
+    # Get parser and index its top-level commands once
+    cmd_index = build_command_index(create_parser())
 
     # Generate pages
-    for category_name, commands in categories.items():
-        # Skip duplicate model commands category (already in global)
-        if category_name == 'model-commands':
-            continue
-
+    for category_name, commands in _CATEGORIES.items():
         output_file = output_dir / f"{category_name}.md"
-        content = generate_category_page(category_name, commands, parser)
+        lines = generate_category_page(category_name, commands, cmd_index)
 
-        print(f"Generating {output_file.name}...")
-        output_file.write_text(content)
+        if write_if_changed(output_file, lines):
+            print(f"Updated {output_file.name}")
+        else:
+            print(f"Unchanged {output_file.name}")
 
     # Generate shell completion page (manual content)
     completion_file = output_dir / "shell-completion.md"
@@ -1,12 +1,15 @@
 """Command-line interface for ComfyUI environment detection."""
 
-from importlib.metadata import version, PackageNotFoundError
+__all__ = ['main', '__version__']
 
-from .cli import main
 
-try:
-    __version__ = version("comfygit")
-except PackageNotFoundError:
-    __version__ = "unknown"
+def __getattr__(name: str):
+    """Resolve package exports from .cli on first access (PEP 562).
 
-__all__ = ['main', '__version__']
+    Importing a submodule, such as the `cg` entry point comfygit_cli.cli or
+    the completers, then doesn't import the CLI or read package metadata twice.
+    """
+    if name in __all__:
+        from . import cli
+        return getattr(cli, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
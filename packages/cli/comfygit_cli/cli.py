@@ -2,27 +2,61 @@
 # PYTHON_ARGCOMPLETE_OK
 
 import argparse
+import importlib
+import io
+import os
 import sys
+from collections.abc import Callable
+from functools import partial
 from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
+from typing import Any, NamedTuple
 
 import argcomplete
 
-from .completion_commands import CompletionCommands
 from .completers import (
     environment_completer,
     installed_node_completer,
     workflow_completer,
 )
-from .env_commands import EnvironmentCommands
-from .global_commands import GlobalCommands
-from .logging.logging_config import setup_logging
 
 try:
     __version__ = version("comfygit")
 except PackageNotFoundError:
     __version__ = "unknown"
 
+# Command handler instances, created on first dispatch (keyed by module name)
+_HANDLER_INSTANCES: dict[str, Any] = {}
+
+
+def _lazy_dispatch(module: str, class_name: str, method: str, args: argparse.Namespace) -> None:
+    """Import the handler module on first use and invoke the bound command method.
+
+    Keeps env/global command backends (and their comfygit_core imports) out of
+    the import graph for --help, parse errors and shell completion.
+    """
+    instance = _HANDLER_INSTANCES.get(module)
+    if instance is None:
+        handler_module = importlib.import_module(f".{module}", __package__)
+        instance = getattr(handler_module, class_name)()
+        _HANDLER_INSTANCES[module] = instance
+    getattr(instance, method)(args)
+
+
+def _global_handler(method: str) -> partial[None]:
+    """Lazily-resolved GlobalCommands method for set_defaults(func=...)."""
+    return partial(_lazy_dispatch, "global_commands", "GlobalCommands", method)
+
+
+def _env_handler(method: str) -> partial[None]:
+    """Lazily-resolved EnvironmentCommands method for set_defaults(func=...)."""
+    return partial(_lazy_dispatch, "env_commands", "EnvironmentCommands", method)
+
+
+def _completion_handler(method: str) -> partial[None]:
+    """Lazily-resolved CompletionCommands method for set_defaults(func=...)."""
+    return partial(_lazy_dispatch, "completion_commands", "CompletionCommands", method)
+
 
 def _get_comfygit_config_dir() -> Path:
     """Get ComfyGit config directory (creates if needed)."""
@@ -61,46 +95,132 @@ def _check_for_old_docker_installation() -> None:
     warning_flag.touch()
 
 
+# Commands whose unrecognized arguments are forwarded rather than rejected
+_PASSTHROUGH_COMMANDS = frozenset({"run"})
+
+# Fixed text of the top-level error paths in main()
+_ERR_PREFIX = "✗ Error: "
+_INTERRUPTED_MSG = "\n✗ Interrupted\n"
+
+
 def main() -> None:
     """Main entry point for ComfyDock CLI."""
+    # Output uses ✓/✗ glyphs throughout; on consoles whose encoding can't
+    # represent them (e.g. cp1252), replace rather than crash mid-command.
+    # stderr already defaults to errors="backslashreplace".
+    if isinstance(sys.stdout, io.TextIOWrapper) and sys.stdout.errors == "strict":
+        sys.stdout.reconfigure(errors="replace")
+
     # Check for old Docker installation (show warning once)
     _check_for_old_docker_installation()
 
-    # Initialize logging system with minimal console output
-    # Environment commands will add file handlers as needed
-    setup_logging(level="INFO", simple_format=True, console_level="CRITICAL")
-
-    # Special handling for 'run' command to pass through ComfyUI args
-    parser = create_parser()
-    if 'run' in sys.argv:
-        # Parse known args, pass unknown to ComfyUI
-        args, unknown = parser.parse_known_args()
-        if getattr(args, 'command', None) == 'run':
-            args.args = unknown
-        else:
-            # Not actually the run command, do normal parsing
-            args = parser.parse_args()
-    else:
-        # Normal parsing for all other commands
-        args = parser.parse_args()
+    # Under shell completion argcomplete exits from inside create_parser(),
+    # after running completers that may load a workspace
+    completing = "_ARGCOMPLETE" in os.environ
+    if completing:
+        _configure_logging()
+    argv = _completion_argv() if completing else sys.argv[1:]
+    command = _peek_command(argv)
+    # Help, --version and bare `cg` only need command names. Any other token
+    # that is not a known command gets the full parser, so a spelling the
+    # peek misreads still parses as it would without narrowing.
+    parser = create_parser(command, names_only=command is None)
+    # Single parse: unknown args are passed through (e.g. to ComfyUI for
+    # 'run') or rejected exactly as parse_args() would
+    args, unknown = parser.parse_known_args()
+    if command in _PASSTHROUGH_COMMANDS:
+        args.args = unknown
+    elif unknown:
+        parser.error(f"unrecognized arguments: {' '.join(unknown)}")
 
     if not hasattr(args, 'func'):
         parser.print_help()
         sys.exit(1)
 
+    # Help, --version and parse errors have exited by now without logging
+    _configure_logging()
+
     try:
         # Execute the command
         args.func(args)
     except KeyboardInterrupt:
-        print("\n✗ Interrupted")
+        sys.stdout.write(_INTERRUPTED_MSG)
         sys.exit(130)
     except Exception as e:
-        print(f"✗ Error: {e}", file=sys.stderr)
+        if os.environ.get("COMFYGIT_DEBUG"):
+            # Keep the traceback when debugging handler failures
+            raise
+        sys.stderr.write(_ERR_PREFIX + str(e) + "\n")
         sys.exit(1)
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser with hierarchical command structure."""
+def _configure_logging() -> None:
+    """Initialize logging system with minimal console output.
+
+    Environment commands will add file handlers as needed.
+    """
+    from .logging.logging_config import setup_logging
+    setup_logging(level="INFO", simple_format=True, console_level="CRITICAL")
+
+
+def _peek_command(argv: list[str]) -> str | None:
+    """Return the top-level command in argv without building the parser.
+
+    Skips global options, including the value of -e/--env in every spelling
+    argparse accepts (abbreviated long options, --env=NAME, -eNAME and short
+    option clusters such as -ve NAME). Returns None when help is requested
+    before any command, so main() builds the names-only parser.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg.startswith("--"):
+            if _is_long_option_prefix(arg, "--help"):
+                return None
+            if _is_long_option_prefix(arg, "--env"):
+                next(args, None)
+        elif arg.startswith("-") and len(arg) > 1:
+            # Short option cluster: flags until -e, whose value is the rest
+            # of the cluster or, when -e comes last, the next argument
+            for i, flag in enumerate(arg[1:], start=1):
+                if flag == "h":
+                    return None
+                if flag == "e":
+                    if i == len(arg) - 1:
+                        next(args, None)
+                    break
+        else:
+            return arg
+    return None
+
+
+def _is_long_option_prefix(arg: str, option: str) -> bool:
+    """Whether arg is option or an abbreviation of it, as argparse matches them."""
+    return arg.startswith("--") and len(arg) > 2 and option.startswith(arg)
+
+
+def _completion_argv() -> list[str]:
+    """Return the finished words of the line being tab-completed.
+
+    The word under the cursor is excluded, so a partially typed command name
+    never narrows the parser down to a single command.
+    """
+    comp_line = os.environ.get("COMP_LINE", "")
+    comp_point = int(os.environ.get("COMP_POINT", len(comp_line)))
+    comp_words = argcomplete.split_line(comp_line, comp_point)[3]
+    return comp_words[1:]
+
+
+def create_parser(command: str | None = None, names_only: bool = False) -> argparse.ArgumentParser:
+    """Create the argument parser with hierarchical command structure.
+
+    Args:
+        command: Top-level command about to be dispatched or completed. When
+            it is known, only that command's subparser tree is built in
+            full.
+        names_only: Register every top-level command by name and help text
+            only. That is all the top-level help, an invalid-choice error or
+            completing a command name needs.
+    """
     parser = argparse.ArgumentParser(
         description="ComfyGit - Manage ComfyUI workspaces and environments",
         prog="cg"
@@ -126,9 +246,14 @@ def create_parser() -> argparse.ArgumentParser:
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Add all commands (workspace and environment)
-    _add_global_commands(subparsers)
-    _add_env_commands(subparsers)
+    # Add all commands (workspace and environment). Commands that won't be
+    # parsed get a name-and-help stub, so top-level usage stays complete.
+    narrowed = command in _COMMANDS
+    for spec in (*_GLOBAL_COMMANDS, *_ENV_COMMANDS):
+        if names_only or (narrowed and spec.name != command):
+            subparsers.add_parser(spec.name, help=spec.help)
+        else:
+            _add_command(subparsers, spec)
 
     # Enable argcomplete for tab completion
     argcomplete.autocomplete(parser)
@@ -136,460 +261,335 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _add_global_commands(subparsers: argparse._SubParsersAction) -> None:
-    """Add global workspace-level commands."""
-    global_cmds = GlobalCommands()
-
-    # init - Initialize workspace
-    init_parser = subparsers.add_parser("init", help="Initialize ComfyGit workspace")
-    init_parser.add_argument("path", type=Path, nargs="?", help="Workspace directory (default: ~/comfygit)")
-    init_parser.add_argument("--models-dir", type=Path, help="Path to existing models directory to index")
-    init_parser.add_argument("--yes", "-y", action="store_true", help="Use all defaults, no interactive prompts")
-    init_parser.set_defaults(func=global_cmds.init)
-
-    # list - List all environments
-    list_parser = subparsers.add_parser("list", help="List all environments")
-    list_parser.set_defaults(func=global_cmds.list_envs)
-
-    # migrate - Import existing ComfyUI
-    # migrate_parser = subparsers.add_parser("migrate", help="Scan and import existing ComfyUI instance")
-    # migrate_parser.add_argument("source_path", type=Path, help="Path to existing ComfyUI")
-    # migrate_parser.add_argument("env_name", help="New environment name")
-    # migrate_parser.add_argument("--scan-only", action="store_true", help="Only scan, don't import")
-    # migrate_parser.set_defaults(func=global_cmds.migrate)
-
-    # import - Import ComfyGit environment
-    import_parser = subparsers.add_parser("import", help="Import ComfyGit environment from tarball or git repository")
-    import_parser.add_argument("path", type=str, nargs="?", help="Path to .tar.gz file or git repository URL (use #subdirectory for subdirectory imports)")
-    import_parser.add_argument("--name", type=str, help="Name for imported environment (skip prompt)")
-    import_parser.add_argument("--branch", "-b", type=str, help="Git branch, tag, or commit to import (git imports only)")
-    import_parser.add_argument(
-        "--torch-backend",
-        default="auto",
-        metavar="BACKEND",
-        help=(
-            "PyTorch backend. Examples: auto (detect GPU), cpu, "
-            "cu128 (CUDA 12.8), cu126, cu124, rocm6.3 (AMD), xpu (Intel). "
-            "Default: auto"
-        ),
-    )
-    import_parser.add_argument("--use", action="store_true", help="Set imported environment as active")
-    import_parser.add_argument("-y", "--yes", action="store_true", help="Skip confirmation prompts, use defaults for workspace initialization")
-    import_parser.set_defaults(func=global_cmds.import_env)
-
-    # export - Export ComfyGit environment
-    export_parser = subparsers.add_parser("export", help="Export ComfyGit environment (include relevant files from .cec)")
-    export_parser.add_argument("path", type=Path, nargs="?", help="Path to output file")
-    export_parser.add_argument("--allow-issues", action="store_true", help="Skip confirmation if models are missing source URLs")
-    export_parser.set_defaults(func=global_cmds.export_env)
-
-    # Model management subcommands
-    model_parser = subparsers.add_parser("model", help="Manage model index")
-    model_subparsers = model_parser.add_subparsers(dest="model_command", help="Model commands")
-
-    # model index subcommands
-    model_index_parser = model_subparsers.add_parser("index", help="Model index operations")
-    model_index_subparsers = model_index_parser.add_subparsers(dest="model_index_command", help="Model index commands")
-
-    # model index find
-    model_index_find_parser = model_index_subparsers.add_parser("find", help="Find models by hash or filename")
-    model_index_find_parser.add_argument("query", help="Search query (hash prefix or filename)")
-    model_index_find_parser.set_defaults(func=global_cmds.model_index_find)
-
-    # model index list
-    model_index_list_parser = model_index_subparsers.add_parser("list", help="List all indexed models")
-    model_index_list_parser.add_argument("--duplicates", action="store_true", help="Show only models with multiple locations")
-    model_index_list_parser.set_defaults(func=global_cmds.model_index_list)
-
-    # model index show
-    model_index_show_parser = model_index_subparsers.add_parser("show", help="Show detailed model information")
-    model_index_show_parser.add_argument("identifier", help="Model hash, hash prefix, filename, or path")
-    model_index_show_parser.set_defaults(func=global_cmds.model_index_show)
-
-    # model index status
-    model_index_status_parser = model_index_subparsers.add_parser("status", help="Show models directory and index status")
-    model_index_status_parser.set_defaults(func=global_cmds.model_index_status)
-
-    # model index sync
-    model_index_sync_parser = model_index_subparsers.add_parser("sync", help="Scan models directory and update index")
-    model_index_sync_parser.set_defaults(func=global_cmds.model_index_sync)
-
-    # model index dir
-    model_index_dir_parser = model_index_subparsers.add_parser("dir", help="Set global models directory to index")
-    model_index_dir_parser.add_argument("path", type=Path, help="Path to models directory")
-    model_index_dir_parser.set_defaults(func=global_cmds.model_dir_add)
-
-    # model download
-    model_download_parser = model_subparsers.add_parser("download", help="Download model from URL")
-    model_download_parser.add_argument("url", help="Model download URL (Civitai, HuggingFace, or direct)")
-    model_download_parser.add_argument("--path", type=str, help="Target path relative to models directory (e.g., checkpoints/model.safetensors)")
-    model_download_parser.add_argument("-c", "--category", type=str, help="Model category for auto-path (e.g., checkpoints, loras, vae)")
-    model_download_parser.add_argument("-y", "--yes", action="store_true", help="Skip path confirmation prompt")
-    model_download_parser.set_defaults(func=global_cmds.model_download)
-
-    # model add-source
-    model_add_source_parser = model_subparsers.add_parser("add-source", help="Add download source URL to model(s)")
-    model_add_source_parser.add_argument("model", nargs="?", help="Model filename or hash (omit for interactive mode)")
-    model_add_source_parser.add_argument("url", nargs="?", help="Download URL")
-    model_add_source_parser.set_defaults(func=global_cmds.model_add_source)
-
-    # Registry management subcommands
-    registry_parser = subparsers.add_parser("registry", help="Manage node registry cache")
-    registry_subparsers = registry_parser.add_subparsers(dest="registry_command", help="Registry commands")
-
-    # registry status
-    registry_status_parser = registry_subparsers.add_parser("status", help="Show registry cache status")
-    registry_status_parser.set_defaults(func=global_cmds.registry_status)
-
-    # registry update
-    registry_update_parser = registry_subparsers.add_parser("update", help="Update registry data from GitHub")
-    registry_update_parser.set_defaults(func=global_cmds.registry_update)
-
-    # Config management
-    config_parser = subparsers.add_parser("config", help="Manage configuration settings")
-    config_parser.add_argument("--civitai-key", type=str, help="Set Civitai API key (use empty string to clear)")
-    config_parser.add_argument("--show", action="store_true", help="Show current configuration")
-    config_parser.set_defaults(func=global_cmds.config)
-
-    # debug - Show application logs for debugging
-    debug_parser = subparsers.add_parser("debug", help="Show application debug logs")
-    debug_parser.add_argument("-n", "--lines", type=int, default=200, help="Number of lines to show (default: 200)")
-    debug_parser.add_argument("--level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Filter by log level")
-    debug_parser.add_argument("--full", action="store_true", help="Show all logs (no line limit)")
-    debug_parser.add_argument("--workspace", action="store_true", help="Show workspace logs instead of environment logs")
-    debug_parser.set_defaults(func=global_cmds.debug)
-
-    # Shell completion management
-    completion_cmds = CompletionCommands()
-    completion_parser = subparsers.add_parser("completion", help="Manage shell tab completion")
-    completion_subparsers = completion_parser.add_subparsers(dest="completion_command", help="Completion commands")
-
-    # completion install
-    completion_install_parser = completion_subparsers.add_parser("install", help="Install tab completion for your shell")
-    completion_install_parser.set_defaults(func=completion_cmds.install)
-
-    # completion uninstall
-    completion_uninstall_parser = completion_subparsers.add_parser("uninstall", help="Remove tab completion from your shell")
-    completion_uninstall_parser.set_defaults(func=completion_cmds.uninstall)
-
-    # completion status
-    completion_status_parser = completion_subparsers.add_parser("status", help="Show tab completion installation status")
-    completion_status_parser.set_defaults(func=completion_cmds.status)
-
-
-def _add_env_commands(subparsers: argparse._SubParsersAction) -> None:
-    """Add environment-specific commands."""
-    env_cmds = EnvironmentCommands()
-
-    # Environment Management Commands (operate ON environments)
+class _Arg(NamedTuple):
+    """One add_argument() call: flags, keyword arguments and optional completer."""
+    flags: tuple[str, ...]
+    kwargs: dict[str, Any]
+    completer: Callable[..., Any] | None = None
+
+
+def _arg(*flags: str, completer: Callable[..., Any] | None = None, **kwargs: Any) -> _Arg:
+    """Spell an argument spec like the add_argument() call it stands for."""
+    return _Arg(flags, kwargs, completer)
+
+
+class _Command(NamedTuple):
+    """Declarative spec of a (sub)command, built by _add_command()."""
+    name: str
+    help: str
+    func: Callable[[argparse.Namespace], None] | None = None
+    args: tuple[_Arg, ...] = ()
+    # add_subparsers() keyword arguments; only used with subcommands
+    subparsers: dict[str, Any] | None = None
+    subcommands: tuple["_Command", ...] = ()
+    add_help: bool = True
+    defaults: dict[str, Any] | None = None
+
+
+def _add_command(subparsers: argparse._SubParsersAction, spec: _Command) -> None:
+    """Add the subparser described by spec, recursing into its subcommands."""
+    parser = subparsers.add_parser(spec.name, help=spec.help, add_help=spec.add_help)
+    for flags, kwargs, completer in spec.args:
+        action = parser.add_argument(*flags, **kwargs)
+        if completer is not None:
+            action.completer = completer  # type: ignore[attr-defined]
+    if spec.subcommands:
+        nested = parser.add_subparsers(**(spec.subparsers or {}))
+        for subcommand in spec.subcommands:
+            _add_command(nested, subcommand)
+    if spec.func is not None:
+        parser.set_defaults(func=spec.func, **(spec.defaults or {}))
+
+
+_TORCH_BACKEND_ARG = _arg(
+    "--torch-backend",
+    default="auto",
+    metavar="BACKEND",
+    help=(
+        "PyTorch backend. Examples: auto (detect GPU), cpu, "
+        "cu128 (CUDA 12.8), cu126, cu124, rocm6.3 (AMD), xpu (Intel). "
+        "Default: auto"
+    ),
+)
 
-    # create - Create new environment
-    create_parser = subparsers.add_parser("create", help="Create new environment")
-    create_parser.add_argument("name", help="Environment name")
-    create_parser.add_argument("--template", type=Path, help="Template manifest")
-    create_parser.add_argument("--python", default="3.11", help="Python version")
-    create_parser.add_argument("--comfyui", help="ComfyUI version")
-    create_parser.add_argument(
-        "--torch-backend",
-        default="auto",
-        metavar="BACKEND",
-        help=(
-            "PyTorch backend. Examples: auto (detect GPU), cpu, "
-            "cu128 (CUDA 12.8), cu126, cu124, rocm6.3 (AMD), xpu (Intel). "
-            "Default: auto"
+# Global workspace-level commands, in help order
+_GLOBAL_COMMANDS: tuple[_Command, ...] = (
+    _Command("init", "Initialize ComfyGit workspace", _global_handler("init"), (
+        _arg("path", type=Path, nargs="?", help="Workspace directory (default: ~/comfygit)"),
+        _arg("--models-dir", type=Path, help="Path to existing models directory to index"),
+        _arg("--yes", "-y", action="store_true", help="Use all defaults, no interactive prompts"),
+    )),
+    _Command("list", "List all environments", _global_handler("list_envs")),
+
+    # migrate - Import existing ComfyUI (disabled)
+    # _Command("migrate", "Scan and import existing ComfyUI instance", _global_handler("migrate"), (
+    #     _arg("source_path", type=Path, help="Path to existing ComfyUI"),
+    #     _arg("env_name", help="New environment name"),
+    #     _arg("--scan-only", action="store_true", help="Only scan, don't import"),
+    # )),
+
+    _Command("import", "Import ComfyGit environment from tarball or git repository", _global_handler("import_env"), (
+        _arg("path", type=str, nargs="?", help="Path to .tar.gz file or git repository URL (use #subdirectory for subdirectory imports)"),
+        _arg("--name", type=str, help="Name for imported environment (skip prompt)"),
+        _arg("--branch", "-b", type=str, help="Git branch, tag, or commit to import (git imports only)"),
+        _TORCH_BACKEND_ARG,
+        _arg("--use", action="store_true", help="Set imported environment as active"),
+        _arg("-y", "--yes", action="store_true", help="Skip confirmation prompts, use defaults for workspace initialization"),
+    )),
+    _Command("export", "Export ComfyGit environment (include relevant files from .cec)", _global_handler("export_env"), (
+        _arg("path", type=Path, nargs="?", help="Path to output file"),
+        _arg("--allow-issues", action="store_true", help="Skip confirmation if models are missing source URLs"),
+    )),
+    _Command(
+        "model", "Manage model index",
+        subparsers={"dest": "model_command", "help": "Model commands"},
+        subcommands=(
+            _Command(
+                "index", "Model index operations",
+                subparsers={"dest": "model_index_command", "help": "Model index commands"},
+                subcommands=(
+                    _Command("find", "Find models by hash or filename", _global_handler("model_index_find"), (
+                        _arg("query", help="Search query (hash prefix or filename)"),
+                    )),
+                    _Command("list", "List all indexed models", _global_handler("model_index_list"), (
+                        _arg("--duplicates", action="store_true", help="Show only models with multiple locations"),
+                    )),
+                    _Command("show", "Show detailed model information", _global_handler("model_index_show"), (
+                        _arg("identifier", help="Model hash, hash prefix, filename, or path"),
+                    )),
+                    _Command("status", "Show models directory and index status", _global_handler("model_index_status")),
+                    _Command("sync", "Scan models directory and update index", _global_handler("model_index_sync")),
+                    _Command("dir", "Set global models directory to index", _global_handler("model_dir_add"), (
+                        _arg("path", type=Path, help="Path to models directory"),
+                    )),
+                ),
+            ),
+            _Command("download", "Download model from URL", _global_handler("model_download"), (
+                _arg("url", help="Model download URL (Civitai, HuggingFace, or direct)"),
+                _arg("--path", type=str, help="Target path relative to models directory (e.g., checkpoints/model.safetensors)"),
+                _arg("-c", "--category", type=str, help="Model category for auto-path (e.g., checkpoints, loras, vae)"),
+                _arg("-y", "--yes", action="store_true", help="Skip path confirmation prompt"),
+            )),
+            _Command("add-source", "Add download source URL to model(s)", _global_handler("model_add_source"), (
+                _arg("model", nargs="?", help="Model filename or hash (omit for interactive mode)"),
+                _arg("url", nargs="?", help="Download URL"),
+            )),
         ),
-    )
-    create_parser.add_argument("--use", action="store_true", help="Set active environment after creation")
-    create_parser.add_argument("-y", "--yes", action="store_true", help="Skip confirmation prompts, use defaults for workspace initialization")
-    create_parser.set_defaults(func=env_cmds.create)
-
-    # use - Set active environment
-    use_parser = subparsers.add_parser("use", help="Set active environment")
-    use_parser.add_argument("name", help="Environment name").completer = environment_completer  # type: ignore[attr-defined]
-    use_parser.set_defaults(func=env_cmds.use)
+    ),
+    _Command(
+        "registry", "Manage node registry cache",
+        subparsers={"dest": "registry_command", "help": "Registry commands"},
+        subcommands=(
+            _Command("status", "Show registry cache status", _global_handler("registry_status")),
+            _Command("update", "Update registry data from GitHub", _global_handler("registry_update")),
+        ),
+    ),
+    _Command("config", "Manage configuration settings", _global_handler("config"), (
+        _arg("--civitai-key", type=str, help="Set Civitai API key (use empty string to clear)"),
+        _arg("--show", action="store_true", help="Show current configuration"),
+    )),
+    _Command("debug", "Show application debug logs", _global_handler("debug"), (
+        _arg("-n", "--lines", type=int, default=200, help="Number of lines to show (default: 200)"),
+        _arg("--level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Filter by log level"),
+        _arg("--full", action="store_true", help="Show all logs (no line limit)"),
+        _arg("--workspace", action="store_true", help="Show workspace logs instead of environment logs"),
+    )),
+    _Command(
+        "completion", "Manage shell tab completion",
+        subparsers={"dest": "completion_command", "help": "Completion commands"},
+        subcommands=(
+            _Command("install", "Install tab completion for your shell", _completion_handler("install")),
+            _Command("uninstall", "Remove tab completion from your shell", _completion_handler("uninstall")),
+            _Command("status", "Show tab completion installation status", _completion_handler("status")),
+        ),
+    ),
+)
 
-    # delete - Delete environment
-    delete_parser = subparsers.add_parser("delete", help="Delete environment")
-    delete_parser.add_argument("name", help="Environment name").completer = environment_completer  # type: ignore[attr-defined]
-    delete_parser.add_argument("-y", "--yes", action="store_true", help="Skip confirmation")
-    delete_parser.set_defaults(func=env_cmds.delete)
+# Environment commands, in help order
+_ENV_COMMANDS: tuple[_Command, ...] = (
+    # Environment Management Commands (operate ON environments)
+    _Command("create", "Create new environment", _env_handler("create"), (
+        _arg("name", help="Environment name"),
+        _arg("--template", type=Path, help="Template manifest"),
+        _arg("--python", default="3.11", help="Python version"),
+        _arg("--comfyui", help="ComfyUI version"),
+        _TORCH_BACKEND_ARG,
+        _arg("--use", action="store_true", help="Set active environment after creation"),
+        _arg("-y", "--yes", action="store_true", help="Skip confirmation prompts, use defaults for workspace initialization"),
+    )),
+    _Command("use", "Set active environment", _env_handler("use"), (
+        _arg("name", help="Environment name", completer=environment_completer),
+    )),
+    _Command("delete", "Delete environment", _env_handler("delete"), (
+        _arg("name", help="Environment name", completer=environment_completer),
+        _arg("-y", "--yes", action="store_true", help="Skip confirmation"),
+    )),
 
     # Environment Operation Commands (operate IN environments, require -e or active)
+    # ComfyUI args after `run` are passed through (see _PASSTHROUGH_COMMANDS)
+    _Command("run", "Run ComfyUI", _env_handler("run"), (
+        _arg("--no-sync", action="store_true", help="Skip environment sync before running"),
+    ), defaults={"args": []}),
+    _Command("status", "Show status (both sync and git status)", _env_handler("status"), (
+        _arg("-v", "--verbose", action="store_true", help="Show full details"),
+    )),
+    _Command("manifest", "Show environment manifest (pyproject.toml)", _env_handler("manifest"), (
+        _arg("--pretty", action="store_true", help="Output as YAML instead of TOML"),
+        _arg("--section", type=str, help="Show specific section (e.g., tool.comfygit.nodes)"),
+    )),
+    # Repair environment drift (manual edits or git operations)
+    _Command("repair", "Repair environment to match pyproject.toml", _env_handler("repair"), (
+        _arg("-y", "--yes", action="store_true", help="Skip confirmation"),
+        _arg(
+            "--models",
+            choices=["all", "required", "skip"],
+            default="all",
+            help="Model download strategy: all (default), required only, or skip"
+        ),
+    )),
+    _Command("log", "Show environment version history", _env_handler("log"), (
+        _arg("-v", "--verbose", action="store_true", help="Show full details"),
+    )),
+    _Command("commit", "Commit environment changes", _env_handler("commit"), (
+        _arg("-m", "--message", help="Commit message (auto-generated if not provided)"),
+        _arg("--auto", action="store_true", help="Auto-resolve issues without interaction"),
+        _arg("--allow-issues", action="store_true", help="Allow committing workflows with unresolved issues"),
+    )),
+    _Command("rollback", "Rollback to a previous version or discard uncommitted changes", _env_handler("rollback"), (
+        _arg("target", nargs="?", help="Version to rollback to (e.g., 'v1', 'v2') - leave empty to discard uncommitted changes"),
+        _arg("-y", "--yes", action="store_true", help="Skip confirmation"),
+        _arg("--force", action="store_true", help="Force rollback, discarding uncommitted changes without error"),
+    )),
+    _Command("pull", "Pull changes from remote and repair environment", _env_handler("pull"), (
+        _arg("-r", "--remote", default="origin", help="Git remote name (default: origin)"),
+        _arg("--models", choices=["all", "required", "skip"], default="all", help="Model download strategy (default: all)"),
+        _arg("--force", action="store_true", help="Discard uncommitted changes and force pull"),
+    )),
+    _Command("push", "Push committed changes to remote", _env_handler("push"), (
+        _arg("-r", "--remote", default="origin", help="Git remote name (default: origin)"),
+        _arg("--force", action="store_true", help="Force push using --force-with-lease (overwrite remote)"),
+    )),
+    _Command(
+        "remote", "Manage git remotes", _env_handler("remote"),
+        subparsers={"dest": "remote_command", "required": True},
+        subcommands=(
+            _Command("add", "Add a git remote", args=(
+                _arg("name", help="Remote name (e.g., origin)"),
+                _arg("url", help="Remote URL"),
+            )),
+            _Command("remove", "Remove a git remote", args=(
+                _arg("name", help="Remote name to remove"),
+            )),
+            _Command("list", "List all git remotes"),
+        ),
+    ),
+    _Command(
+        "node", "Manage custom nodes",
+        subparsers={"dest": "node_command", "help": "Node commands"},
+        subcommands=(
+            _Command("add", "Add custom node(s)", _env_handler("node_add"), (
+                _arg("node_names", nargs="+", help="Node identifier(s): registry-id[@version], github-url[@ref], or directory name"),
+                _arg("--dev", action="store_true", help="Track existing local development node"),
+                _arg("--no-test", action="store_true", help="Don't test resolution"),
+                _arg("--force", action="store_true", help="Force overwrite existing directory"),
+                _arg("--verbose", "-v", action="store_true", help="Show full UV error output for dependency conflicts"),
+            )),
+            _Command("remove", "Remove custom node(s)", _env_handler("node_remove"), (
+                _arg("node_names", nargs="+", help="Node registry ID(s) or name(s)", completer=installed_node_completer),
+                _arg("--dev", action="store_true", help="Remove development node specifically"),
+            )),
+            _Command("prune", "Remove unused custom nodes", _env_handler("node_prune"), (
+                _arg("--exclude", nargs="+", metavar="PACKAGE", help="Package IDs to keep even if unused"),
+                _arg("-y", "--yes", action="store_true", help="Skip confirmation prompt"),
+            )),
+            _Command("list", "List custom nodes", _env_handler("node_list")),
+            _Command("update", "Update custom node", _env_handler("node_update"), (
+                _arg("node_name", help="Node identifier or name to update", completer=installed_node_completer),
+                _arg("-y", "--yes", action="store_true", help="Auto-confirm updates (skip prompts)"),
+                _arg("--no-test", action="store_true", help="Don't test resolution"),
+            )),
+        ),
+    ),
+    _Command(
+        "workflow", "Manage workflows",
+        subparsers={"dest": "workflow_command", "help": "Workflow commands"},
+        subcommands=(
+            _Command("list", "List all workflows with sync status", _env_handler("workflow_list")),
+            _Command("resolve", "Resolve workflow dependencies (nodes & models)", _env_handler("workflow_resolve"), (
+                _arg("name", help="Workflow name to resolve", completer=workflow_completer),
+                _arg("--auto", action="store_true", help="Auto-resolve without interaction"),
+                _arg("--install", action="store_true", help="Auto-install missing nodes without prompting"),
+                _arg("--no-install", action="store_true", help="Skip node installation prompt"),
+            )),
+            # workflow model importance
+            _Command(
+                "model", "Manage workflow models",
+                subparsers={"dest": "model_command", "help": "Model management commands"},
+                subcommands=(
+                    _Command("importance", "Set model importance (required/flexible/optional)", _env_handler("workflow_model_importance"), (
+                        _arg("workflow_name", nargs="?", help="Workflow name (interactive if omitted)", completer=workflow_completer),
+                        _arg("model_identifier", nargs="?", help="Model filename or hash (interactive if omitted)"),
+                        _arg("importance", nargs="?", choices=["required", "flexible", "optional"], help="Importance level"),
+                    )),
+                ),
+            ),
+        ),
+    ),
+    _Command(
+        "constraint", "Manage UV constraint dependencies",
+        subparsers={"dest": "constraint_command", "help": "Constraint commands"},
+        subcommands=(
+            _Command("add", "Add constraint dependencies", _env_handler("constraint_add"), (
+                _arg("packages", nargs="+", help="Package specifications (e.g., torch==2.4.1)"),
+            )),
+            _Command("list", "List constraint dependencies", _env_handler("constraint_list")),
+            _Command("remove", "Remove constraint dependencies", _env_handler("constraint_remove"), (
+                _arg("packages", nargs="+", help="Package names to remove"),
+            )),
+        ),
+    ),
+    _Command(
+        "py", "Manage Python dependencies",
+        subparsers={"dest": "py_command", "help": "Python dependency commands"},
+        subcommands=(
+            _Command("add", "Add Python dependencies", _env_handler("py_add"), (
+                _arg("packages", nargs="*", help="Package specifications (e.g., requests>=2.0.0)"),
+                _arg("-r", "--requirements", type=Path, help="Add packages from requirements.txt file"),
+                _arg("--upgrade", action="store_true", help="Upgrade existing packages"),
+                # Tier 2: Power-user flags
+                _arg("--group", help="Add to dependency group (e.g., optional-cuda)"),
+                _arg("--dev", action="store_true", help="Add to dev dependencies"),
+                _arg("--editable", action="store_true", help="Install as editable (for local development)"),
+                _arg("--bounds", choices=["lower", "major", "minor", "exact"], help="Version specifier style"),
+            )),
+            _Command("remove", "Remove Python dependencies", _env_handler("py_remove"), (
+                _arg("packages", nargs="+", help="Package names to remove"),
+                _arg("--group", help="Remove packages from dependency group instead of main dependencies"),
+            )),
+            _Command("remove-group", "Remove entire dependency group", _env_handler("py_remove_group"), (
+                _arg("group", help="Dependency group name to remove"),
+            )),
+            _Command("list", "List project dependencies", _env_handler("py_list"), (
+                _arg("--all", action="store_true", help="Show all dependencies including dependency groups"),
+            )),
+            # py uv - Direct UV passthrough for advanced users
+            _Command(
+                "uv", "Direct UV passthrough (advanced)", _env_handler("py_uv"), (
+                    _arg(
+                        "uv_args",
+                        nargs=argparse.REMAINDER,  # Capture everything after 'uv'
+                        help="UV command and arguments (e.g., 'add --group optional-cuda sageattention')"
+                    ),
+                ),
+                add_help=False,  # Don't interfere with UV's --help
+            ),
+        ),
+    ),
+)
 
-    # run - Run ComfyUI (special handling for ComfyUI args)
-    run_parser = subparsers.add_parser("run", help="Run ComfyUI")
-    run_parser.add_argument("--no-sync", action="store_true", help="Skip environment sync before running")
-    run_parser.set_defaults(func=env_cmds.run, args=[])
-
-    # status - Show environment status
-    status_parser = subparsers.add_parser("status", help="Show status (both sync and git status)")
-    status_parser.add_argument("-v", "--verbose", action="store_true", help="Show full details")
-    status_parser.set_defaults(func=env_cmds.status)
-
-    # manifest - Show environment manifest
-    manifest_parser = subparsers.add_parser("manifest", help="Show environment manifest (pyproject.toml)")
-    manifest_parser.add_argument("--pretty", action="store_true", help="Output as YAML instead of TOML")
-    manifest_parser.add_argument("--section", type=str, help="Show specific section (e.g., tool.comfygit.nodes)")
-    manifest_parser.set_defaults(func=env_cmds.manifest)
-
-    # repair - Repair environment drift (manual edits or git operations)
-    repair_parser = subparsers.add_parser("repair", help="Repair environment to match pyproject.toml")
-    repair_parser.add_argument("-y", "--yes", action="store_true", help="Skip confirmation")
-    repair_parser.add_argument(
-        "--models",
-        choices=["all", "required", "skip"],
-        default="all",
-        help="Model download strategy: all (default), required only, or skip"
-    )
-    repair_parser.set_defaults(func=env_cmds.repair)
-
-    # log - Show version history
-    log_parser = subparsers.add_parser("log", help="Show environment version history")
-    log_parser.add_argument("-v", "--verbose", action="store_true", help="Show full details")
-    log_parser.set_defaults(func=env_cmds.log)
-
-    # commit - Save environment changes
-    commit_parser = subparsers.add_parser("commit", help="Commit environment changes")
-    commit_parser.add_argument("-m", "--message", help="Commit message (auto-generated if not provided)")
-    commit_parser.add_argument("--auto", action="store_true", help="Auto-resolve issues without interaction")
-    commit_parser.add_argument("--allow-issues", action="store_true", help="Allow committing workflows with unresolved issues")
-    commit_parser.set_defaults(func=env_cmds.commit)
-
-    # rollback - Revert changes
-    rollback_parser = subparsers.add_parser("rollback", help="Rollback to a previous version or discard uncommitted changes")
-    rollback_parser.add_argument("target", nargs="?", help="Version to rollback to (e.g., 'v1', 'v2') - leave empty to discard uncommitted changes")
-    rollback_parser.add_argument("-y", "--yes", action="store_true", help="Skip confirmation")
-    rollback_parser.add_argument("--force", action="store_true", help="Force rollback, discarding uncommitted changes without error")
-    rollback_parser.set_defaults(func=env_cmds.rollback)
-
-    # pull - Pull from remote and sync
-    pull_parser = subparsers.add_parser(
-        "pull",
-        help="Pull changes from remote and repair environment"
-    )
-    pull_parser.add_argument(
-        "-r", "--remote",
-        default="origin",
-        help="Git remote name (default: origin)"
-    )
-    pull_parser.add_argument(
-        "--models",
-        choices=["all", "required", "skip"],
-        default="all",
-        help="Model download strategy (default: all)"
-    )
-    pull_parser.add_argument(
-        "--force",
-        action="store_true",
-        help="Discard uncommitted changes and force pull"
-    )
-    pull_parser.set_defaults(func=env_cmds.pull)
-
-    # push - Push commits to remote
-    push_parser = subparsers.add_parser(
-        "push",
-        help="Push committed changes to remote"
-    )
-    push_parser.add_argument(
-        "-r", "--remote",
-        default="origin",
-        help="Git remote name (default: origin)"
-    )
-    push_parser.add_argument(
-        "--force",
-        action="store_true",
-        help="Force push using --force-with-lease (overwrite remote)"
-    )
-    push_parser.set_defaults(func=env_cmds.push)
-
-    # remote - Manage git remotes
-    remote_parser = subparsers.add_parser(
-        "remote",
-        help="Manage git remotes"
-    )
-    remote_subparsers = remote_parser.add_subparsers(
-        dest="remote_command",
-        required=True
-    )
-
-    # remote add
-    remote_add_parser = remote_subparsers.add_parser(
-        "add",
-        help="Add a git remote"
-    )
-    remote_add_parser.add_argument(
-        "name",
-        help="Remote name (e.g., origin)"
-    )
-    remote_add_parser.add_argument(
-        "url",
-        help="Remote URL"
-    )
-
-    # remote remove
-    remote_remove_parser = remote_subparsers.add_parser(
-        "remove",
-        help="Remove a git remote"
-    )
-    remote_remove_parser.add_argument(
-        "name",
-        help="Remote name to remove"
-    )
-
-    # remote list
-    remote_list_parser = remote_subparsers.add_parser(
-        "list",
-        help="List all git remotes"
-    )
-
-    remote_parser.set_defaults(func=env_cmds.remote)
-
-    # Node management subcommands
-    node_parser = subparsers.add_parser("node", help="Manage custom nodes")
-    node_subparsers = node_parser.add_subparsers(dest="node_command", help="Node commands")
-
-    # node add
-    node_add_parser = node_subparsers.add_parser("add", help="Add custom node(s)")
-    node_add_parser.add_argument("node_names", nargs="+", help="Node identifier(s): registry-id[@version], github-url[@ref], or directory name")
-    node_add_parser.add_argument("--dev", action="store_true", help="Track existing local development node")
-    node_add_parser.add_argument("--no-test", action="store_true", help="Don't test resolution")
-    node_add_parser.add_argument("--force", action="store_true", help="Force overwrite existing directory")
-    node_add_parser.add_argument("--verbose", "-v", action="store_true", help="Show full UV error output for dependency conflicts")
-    node_add_parser.set_defaults(func=env_cmds.node_add)
-
-    # node remove
-    node_remove_parser = node_subparsers.add_parser("remove", help="Remove custom node(s)")
-    node_remove_parser.add_argument("node_names", nargs="+", help="Node registry ID(s) or name(s)").completer = installed_node_completer  # type: ignore[attr-defined]
-    node_remove_parser.add_argument("--dev", action="store_true", help="Remove development node specifically")
-    node_remove_parser.set_defaults(func=env_cmds.node_remove)
-
-    # node prune
-    node_prune_parser = node_subparsers.add_parser("prune", help="Remove unused custom nodes")
-    node_prune_parser.add_argument("--exclude", nargs="+", metavar="PACKAGE", help="Package IDs to keep even if unused")
-    node_prune_parser.add_argument("-y", "--yes", action="store_true", help="Skip confirmation prompt")
-    node_prune_parser.set_defaults(func=env_cmds.node_prune)
-
-    # node list
-    node_list_parser = node_subparsers.add_parser("list", help="List custom nodes")
-    node_list_parser.set_defaults(func=env_cmds.node_list)
-
-    # node update
-    node_update_parser = node_subparsers.add_parser("update", help="Update custom node")
-    node_update_parser.add_argument("node_name", help="Node identifier or name to update").completer = installed_node_completer  # type: ignore[attr-defined]
-    node_update_parser.add_argument("-y", "--yes", action="store_true", help="Auto-confirm updates (skip prompts)")
-    node_update_parser.add_argument("--no-test", action="store_true", help="Don't test resolution")
-    node_update_parser.set_defaults(func=env_cmds.node_update)
-
-    # Workflow management subcommands
-    workflow_parser = subparsers.add_parser("workflow", help="Manage workflows")
-    workflow_subparsers = workflow_parser.add_subparsers(dest="workflow_command", help="Workflow commands")
-
-    # workflow list
-    workflow_list_parser = workflow_subparsers.add_parser("list", help="List all workflows with sync status")
-    workflow_list_parser.set_defaults(func=env_cmds.workflow_list)
-
-    # workflow resolve
-    workflow_resolve_parser = workflow_subparsers.add_parser("resolve", help="Resolve workflow dependencies (nodes & models)")
-    workflow_resolve_parser.add_argument("name", help="Workflow name to resolve").completer = workflow_completer  # type: ignore[attr-defined]
-    workflow_resolve_parser.add_argument("--auto", action="store_true", help="Auto-resolve without interaction")
-    workflow_resolve_parser.add_argument("--install", action="store_true", help="Auto-install missing nodes without prompting")
-    workflow_resolve_parser.add_argument("--no-install", action="store_true", help="Skip node installation prompt")
-    workflow_resolve_parser.set_defaults(func=env_cmds.workflow_resolve)
-
-    # workflow model importance
-    workflow_importance_parser = workflow_subparsers.add_parser(
-        "model",
-        help="Manage workflow models"
-    )
-    workflow_model_subparsers = workflow_importance_parser.add_subparsers(
-        dest="model_command",
-        help="Model management commands"
-    )
+# Top-level command name -> spec
+_COMMANDS: dict[str, _Command] = {spec.name: spec for spec in (*_GLOBAL_COMMANDS, *_ENV_COMMANDS)}
 
-    importance_parser = workflow_model_subparsers.add_parser(
-        "importance",
-        help="Set model importance (required/flexible/optional)"
-    )
-    importance_parser.add_argument(
-        "workflow_name",
-        nargs="?",
-        help="Workflow name (interactive if omitted)"
-    ).completer = workflow_completer  # type: ignore[attr-defined]
-    importance_parser.add_argument(
-        "model_identifier",
-        nargs="?",
-        help="Model filename or hash (interactive if omitted)"
-    )
-    importance_parser.add_argument(
-        "importance",
-        nargs="?",
-        choices=["required", "flexible", "optional"],
-        help="Importance level"
-    )
-    importance_parser.set_defaults(func=env_cmds.workflow_model_importance)
-
-    # Constraint management subcommands
-    constraint_parser = subparsers.add_parser("constraint", help="Manage UV constraint dependencies")
-    constraint_subparsers = constraint_parser.add_subparsers(dest="constraint_command", help="Constraint commands")
-
-    # constraint add
-    constraint_add_parser = constraint_subparsers.add_parser("add", help="Add constraint dependencies")
-    constraint_add_parser.add_argument("packages", nargs="+", help="Package specifications (e.g., torch==2.4.1)")
-    constraint_add_parser.set_defaults(func=env_cmds.constraint_add)
-
-    # constraint list
-    constraint_list_parser = constraint_subparsers.add_parser("list", help="List constraint dependencies")
-    constraint_list_parser.set_defaults(func=env_cmds.constraint_list)
-
-    # constraint remove
-    constraint_remove_parser = constraint_subparsers.add_parser("remove", help="Remove constraint dependencies")
-    constraint_remove_parser.add_argument("packages", nargs="+", help="Package names to remove")
-    constraint_remove_parser.set_defaults(func=env_cmds.constraint_remove)
-
-    # Python dependency management subcommands
-    py_parser = subparsers.add_parser("py", help="Manage Python dependencies")
-    py_subparsers = py_parser.add_subparsers(dest="py_command", help="Python dependency commands")
-
-    # py add
-    py_add_parser = py_subparsers.add_parser("add", help="Add Python dependencies")
-    py_add_parser.add_argument("packages", nargs="*", help="Package specifications (e.g., requests>=2.0.0)")
-    py_add_parser.add_argument("-r", "--requirements", type=Path, help="Add packages from requirements.txt file")
-    py_add_parser.add_argument("--upgrade", action="store_true", help="Upgrade existing packages")
-    # Tier 2: Power-user flags
-    py_add_parser.add_argument("--group", help="Add to dependency group (e.g., optional-cuda)")
-    py_add_parser.add_argument("--dev", action="store_true", help="Add to dev dependencies")
-    py_add_parser.add_argument("--editable", action="store_true", help="Install as editable (for local development)")
-    py_add_parser.add_argument("--bounds", choices=["lower", "major", "minor", "exact"], help="Version specifier style")
-    py_add_parser.set_defaults(func=env_cmds.py_add)
-
-    # py remove
-    py_remove_parser = py_subparsers.add_parser("remove", help="Remove Python dependencies")
-    py_remove_parser.add_argument("packages", nargs="+", help="Package names to remove")
-    py_remove_parser.add_argument("--group", help="Remove packages from dependency group instead of main dependencies")
-    py_remove_parser.set_defaults(func=env_cmds.py_remove)
-
-    # py remove-group
-    py_remove_group_parser = py_subparsers.add_parser("remove-group", help="Remove entire dependency group")
-    py_remove_group_parser.add_argument("group", help="Dependency group name to remove")
-    py_remove_group_parser.set_defaults(func=env_cmds.py_remove_group)
-
-    # py list
-    py_list_parser = py_subparsers.add_parser("list", help="List project dependencies")
-    py_list_parser.add_argument("--all", action="store_true", help="Show all dependencies including dependency groups")
-    py_list_parser.set_defaults(func=env_cmds.py_list)
-
-    # py uv - Direct UV passthrough for advanced users
-    py_uv_parser = py_subparsers.add_parser(
-        "uv",
-        help="Direct UV passthrough (advanced)",
-        add_help=False  # Don't interfere with UV's --help
-    )
-    py_uv_parser.add_argument(
-        "uv_args",
-        nargs=argparse.REMAINDER,  # Capture everything after 'uv'
-        help="UV command and arguments (e.g., 'add --group optional-cuda sageattention')"
-    )
-    py_uv_parser.set_defaults(func=env_cmds.py_uv)
 
 if __name__ == "__main__":
     main()
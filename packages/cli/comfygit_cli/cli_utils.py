@@ -1,6 +1,9 @@
 """Utility functions for ComfyDock CLI."""
 
+import io
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager, redirect_stdout
 from typing import TYPE_CHECKING
 
 from comfygit_core.factories.workspace_factory import WorkspaceFactory
@@ -30,3 +33,17 @@ def get_workspace_optional() -> "Workspace | None":
         return workspace
     except CDWorkspaceNotFoundError:
         return None
+
+@contextmanager
+def buffered_stdout() -> Iterator[None]:
+    """Collect everything printed in the block and write it to stdout at once.
+
+    Multi-line reports otherwise cost one write per line on a terminal.
+    Output is flushed even if the block raises or exits.
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
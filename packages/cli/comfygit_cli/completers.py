@@ -1,21 +1,24 @@
 """Custom argcomplete completers for ComfyDock CLI."""
 import argparse
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from argcomplete.io import warn
 
-from comfygit_core.core.environment import Environment
-from comfygit_core.core.workspace import Workspace
-from comfygit_core.factories.workspace_factory import WorkspaceFactory
-from comfygit_core.models.exceptions import CDWorkspaceNotFoundError
+if TYPE_CHECKING:
+    from comfygit_core.core.environment import Environment
+    from comfygit_core.core.workspace import Workspace
 
 
 # ============================================================================
 # Shared Utilities
 # ============================================================================
 
-def get_workspace_safe() -> Workspace | None:
+def get_workspace_safe() -> "Workspace | None":
     """Get workspace or return None if not initialized."""
+    # comfygit_core is imported on first completion, not when the parser is built
+    from comfygit_core.factories.workspace_factory import WorkspaceFactory
+    from comfygit_core.models.exceptions import CDWorkspaceNotFoundError
+
     try:
         return WorkspaceFactory.find()
     except CDWorkspaceNotFoundError:
@@ -25,7 +28,7 @@ def get_workspace_safe() -> Workspace | None:
         return None
 
 
-def get_env_from_args(parsed_args: argparse.Namespace, workspace: Workspace) -> Environment | None:
+def get_env_from_args(parsed_args: argparse.Namespace, workspace: "Workspace") -> "Environment | None":
     """Get environment from -e flag or active environment.
 
     Args:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import difflib
 import os
 import subprocess
 import sys
@@ -20,7 +21,7 @@ if TYPE_CHECKING:
     from comfygit_core.models.environment import EnvironmentStatus
     from comfygit_core.models.workflow import WorkflowAnalysisStatus
 
-from .cli_utils import get_workspace_or_exit
+from .cli_utils import buffered_stdout, get_workspace_or_exit
 from .logging.environment_logger import with_env_logging
 from .logging.logging_config import get_logger
 
@@ -32,12 +33,18 @@ class EnvironmentCommands:
 
     def __init__(self) -> None:
         """Initialize environment commands handler."""
-        pass
+        # Resolved environments keyed by -e name (None = active environment)
+        self._env_cache: dict[str | None, Environment] = {}
 
     @cached_property
     def workspace(self) -> Workspace:
         return get_workspace_or_exit()
 
+    @cached_property
+    def _env_names(self) -> list[str]:
+        """Environment names, enumerated at most once per process."""
+        return [e.name for e in self.workspace.list_environments()]
+
     def _get_or_create_workspace(self, args: argparse.Namespace) -> Workspace:
         """Get existing workspace or initialize a new one with user confirmation.
 
@@ -58,6 +65,9 @@ class EnvironmentCommands:
     def _get_env(self, args) -> Environment:
         """Get environment from global -e flag or active environment.
 
+        Each environment is resolved once per instance: with_env_logging
+        looks it up before the command body asks for it again.
+
         Args:
             args: Parsed command line arguments
 
@@ -67,16 +77,27 @@ class EnvironmentCommands:
         Raises:
             SystemExit if no environment specified
         """
+        target_env = getattr(args, 'target_env', None) or None
+        env = self._env_cache.get(target_env)
+        if env is None:
+            env = self._env_cache[target_env] = self._resolve_env(args)
+        return env
+
+    def _resolve_env(self, args) -> Environment:
+        """Look up the environment for _get_env(), exiting if there is none."""
         # Check global -e flag first
-        if hasattr(args, 'target_env') and args.target_env:
+        if getattr(args, 'target_env', None):
             try:
                 env = self.workspace.get_environment(args.target_env)
                 return env
             except Exception:
                 print(f"✗ Unknown environment: {args.target_env}")
+                suggestions = difflib.get_close_matches(args.target_env, self._env_names, n=5)
+                if suggestions:
+                    print(f"Did you mean: {', '.join(suggestions)}?")
                 print("Available environments:")
-                for e in self.workspace.list_environments():
-                    print(f"  • {e.name}")
+                for name in self._env_names:
+                    print(f"  • {name}")
                 sys.exit(1)
 
         # Fall back to active environment
@@ -190,7 +211,7 @@ class EnvironmentCommands:
     def run(self, args: argparse.Namespace) -> None:
         """Run ComfyUI in the specified environment."""
         env = self._get_env(args)
-        comfyui_args = args.args if hasattr(args, 'args') else []
+        comfyui_args = args.args
 
         print(f"🎮 Starting ComfyUI in environment: {env.name}")
         if comfyui_args:
@@ -213,7 +234,7 @@ class EnvironmentCommands:
         config = env.pyproject.load()
 
         # Handle section filtering if requested
-        if hasattr(args, 'section') and args.section:
+        if getattr(args, 'section', None):
             # Navigate to requested section using dot notation
             keys = args.section.split('.')
             current = config
@@ -234,7 +255,7 @@ class EnvironmentCommands:
                 sys.exit(1)
 
         # Output format
-        if hasattr(args, 'pretty') and args.pretty:
+        if getattr(args, 'pretty', False):
             # Convert tomlkit objects to plain Python types recursively
             def to_plain(obj):
                 """Recursively convert tomlkit objects to plain Python types."""
@@ -260,6 +281,11 @@ class EnvironmentCommands:
 
         status = env.status()
 
+        with buffered_stdout():
+            self._print_status(env, status)
+
+    def _print_status(self, env: Environment, status: EnvironmentStatus) -> None:
+        """Print the status report for an environment."""
         # Clean state - everything is good
         if status.is_synced and not status.git.has_changes and status.workflow.sync_status.total_count == 0:
             print(f"Environment: {env.name} ✓")
@@ -549,102 +575,38 @@ class EnvironmentCommands:
             for s in suggestions:
                 print(f"  {s}")
 
-    def _show_git_changes(self, status: EnvironmentStatus) -> None:
-        """Helper method to show git changes in a structured way."""
-        # Show node changes
-        if status.git.nodes_added or status.git.nodes_removed:
-            print("\n  Custom Nodes:")
-            for node in status.git.nodes_added:
-                if isinstance(node, dict):
-                    name = node['name']
-                    suffix = ' (development)' if node.get('is_development') else ''
-                    print(f"    + {name}{suffix}")
-                else:
-                    # Backwards compatibility for string format
-                    print(f"    + {node}")
-            for node in status.git.nodes_removed:
-                if isinstance(node, dict):
-                    name = node['name']
-                    suffix = ' (development)' if node.get('is_development') else ''
-                    print(f"    - {name}{suffix}")
-                else:
-                    # Backwards compatibility for string format
-                    print(f"    - {node}")
-
-        # Show dependency changes
-        if status.git.dependencies_added or status.git.dependencies_removed or status.git.dependencies_updated:
-            print("\n  Python Packages:")
-            for dep in status.git.dependencies_added:
-                version = dep.get('version', 'any')
-                source = dep.get('source', '')
-                if source:
-                    print(f"    + {dep['name']} ({version}) [{source}]")
-                else:
-                    print(f"    + {dep['name']} ({version})")
-            for dep in status.git.dependencies_removed:
-                version = dep.get('version', 'any')
-                print(f"    - {dep['name']} ({version})")
-            for dep in status.git.dependencies_updated:
-                old = dep.get('old_version', 'any')
-                new = dep.get('new_version', 'any')
-                print(f"    ~ {dep['name']}: {old} → {new}")
-
-        # Show constraint changes
-        if status.git.constraints_added or status.git.constraints_removed:
-            print("\n  Constraint Dependencies:")
-            for constraint in status.git.constraints_added:
-                print(f"    + {constraint}")
-            for constraint in status.git.constraints_removed:
-                print(f"    - {constraint}")
-
-        # Show workflow changes (tracking and content)
-        workflow_changes_shown = False
-
-        # Workflow tracking no longer needed - all workflows are automatically managed
-
-        # Show workflow file changes
-        if status.git.workflow_changes:
-            if not workflow_changes_shown:
-                print("\n  Workflows:")
-                workflow_changes_shown = True
-            for workflow_name, git_status in status.git.workflow_changes.items():
-                if git_status == "modified":
-                    print(f"    ~ {workflow_name}.json")
-                elif git_status == "added":
-                    print(f"    + {workflow_name}.json")
-                elif git_status == "deleted":
-                    print(f"    - {workflow_name}.json")
-
     @with_env_logging("log")
     def log(self, args: argparse.Namespace, logger=None) -> None:
         """Show environment version history with simple identifiers."""
         env = self._get_env(args)
 
         try:
-            versions = env.get_versions(limit=20)
+            versions = env.get_versions(limit=20, newest_first=True)
 
             if not versions:
                 print("No version history yet")
                 print("\nTip: Run 'cg commit' to create your first version")
                 return
 
-            print(f"Version history for environment '{env.name}':\n")
+            with buffered_stdout():
+                print(f"Version history for environment '{env.name}':\n")
 
-            if not args.verbose:
-                # Compact format
-                for version in reversed(versions):  # Show newest first
-                    print(f"{version['version']}: {version['message']}")
-                print()
-            else:
-                # Detailed format
-                for version in reversed(versions):  # Show newest first
-                    print(f"Version: {version['version']}")
-                    print(f"Message: {version['message']}")
-                    print(f"Date:    {version['date'][:19]}")  # Trim timezone for readability
-                    print(f"Commit:  {version['hash'][:8]}")
-                    print('\n')
+                if not args.verbose:
+                    # Compact format
+                    for version in versions:
+                        print(f"{version['version']}: {version['message']}")
+                    print()
+                else:
+                    # Detailed format (date trimmed of timezone for readability)
+                    for version in versions:
+                        print(
+                            f"Version: {version['version']}\n"
+                            f"Message: {version['message']}\n"
+                            f"Date:    {version['date'][:19]}\n"
+                            f"Commit:  {version['hash'][:8]}\n\n"
+                        )
 
-            print("Use 'cg rollback <version>' to restore to a specific version")
+                print("Use 'cg rollback <version>' to restore to a specific version")
 
         except Exception as e:
             if logger:
@@ -831,7 +793,7 @@ class EnvironmentCommands:
         env = self._get_env(args)
 
         # Get unused nodes
-        exclude = args.exclude if hasattr(args, 'exclude') and args.exclude else None
+        exclude = getattr(args, 'exclude', None) or None
         try:
             unused = env.get_unused_nodes(exclude=exclude)
         except Exception as e:
@@ -905,19 +867,20 @@ class EnvironmentCommands:
             print("No custom nodes installed")
             return
 
-        print(f"Custom nodes in '{env.name}':")
-        for node in nodes:
-            # Format version display based on source type
-            version_suffix = ""
-            if node.version:
-                if node.source == "git":
-                    version_suffix = f" @ {node.version[:8]}"
-                elif node.source == "registry":
-                    version_suffix = f" v{node.version}"
-                elif node.source == "development":
-                    version_suffix = " (dev)"
-
-            print(f"  • {node.registry_id or node.name} ({node.source}){version_suffix}")
+        with buffered_stdout():
+            print(f"Custom nodes in '{env.name}':")
+            for node in nodes:
+                # Format version display based on source type
+                version_suffix = ""
+                if node.version:
+                    if node.source == "git":
+                        version_suffix = f" @ {node.version[:8]}"
+                    elif node.source == "registry":
+                        version_suffix = f" v{node.version}"
+                    elif node.source == "development":
+                        version_suffix = " (dev)"
+
+                print(f"  • {node.registry_id or node.name} ({node.source}){version_suffix}")
 
     @with_env_logging("env node update")
     def node_update(self, args: argparse.Namespace, logger=None) -> None:
@@ -974,10 +937,9 @@ class EnvironmentCommands:
 
         print(f"📦 Adding constraints: {' '.join(args.packages)}")
 
-        # Add each constraint
+        # Add all constraints in one pyproject write
         try:
-            for package in args.packages:
-                env.add_constraint(package)
+            env.add_constraints(args.packages)
         except Exception as e:
             if logger:
                 logger.error(f"Constraint add failed: {e}", exc_info=True)
@@ -1011,14 +973,13 @@ class EnvironmentCommands:
 
         print(f"🗑 Removing constraints: {' '.join(args.packages)}")
 
-        # Remove each constraint
-        removed_count = 0
+        # Remove all constraints in one pyproject write
         try:
+            removed = env.remove_constraints(args.packages)
             for package in args.packages:
-                if env.remove_constraint(package):
-                    removed_count += 1
-                else:
+                if package not in removed:
                     print(f"   Warning: constraint '{package}' not found")
+            removed_count = len(removed)
         except Exception as e:
             if logger:
                 logger.error(f"Constraint remove failed: {e}", exc_info=True)
@@ -1101,7 +1062,7 @@ class EnvironmentCommands:
         env = self._get_env(args)
 
         # Handle --group flag (remove from dependency group)
-        if hasattr(args, 'group') and args.group:
+        if getattr(args, 'group', None):
             group_name = args.group
             print(f"🗑 Removing {len(args.packages)} package(s) from group '{group_name}'...")
 
@@ -1226,29 +1187,30 @@ class EnvironmentCommands:
             print("No project dependencies or dependency groups")
             return
 
-        # Display dependencies grouped by section
-        first_group = True
-        for group_name, group_deps in all_deps.items():
-            if not group_deps:
-                continue
-
-            if not first_group:
-                print()  # Blank line between groups
-            first_group = False
-
-            # Format the header
-            if group_name == "dependencies":
-                print(f"Dependencies ({len(group_deps)}):")
-                for dep in group_deps:
-                    print(f"  • {dep}")
-            else:
-                print(f"{group_name} ({len(group_deps)}):")
-                for dep in group_deps:
-                    print(f"  • {dep}")
+        with buffered_stdout():
+            # Display dependencies grouped by section
+            first_group = True
+            for group_name, group_deps in all_deps.items():
+                if not group_deps:
+                    continue
+
+                if not first_group:
+                    print()  # Blank line between groups
+                first_group = False
+
+                # Format the header
+                if group_name == "dependencies":
+                    print(f"Dependencies ({len(group_deps)}):")
+                    for dep in group_deps:
+                        print(f"  • {dep}")
+                else:
+                    print(f"{group_name} ({len(group_deps)}):")
+                    for dep in group_deps:
+                        print(f"  • {dep}")
 
-        # Show tip if not showing all groups
-        if not args.all and len(all_deps) == 1:
-            print("\nTip: Use --all to see dependency groups")
+            # Show tip if not showing all groups
+            if not args.all and len(all_deps) == 1:
+                print("\nTip: Use --all to see dependency groups")
 
     # === Git-based operations ===
 
@@ -1398,7 +1360,7 @@ class EnvironmentCommands:
             if preview['nodes_to_install']:
                 print("\n⬇️  Installing nodes...")
 
-            model_strategy = getattr(args, 'models', 'all')
+            model_strategy = args.models
             sync_result = env.sync(
                 model_strategy=model_strategy,
                 model_callbacks=model_callbacks,
@@ -1446,7 +1408,8 @@ class EnvironmentCommands:
                 print(f"⏮ Discarding uncommitted changes in environment '{env.name}'")
 
             # Choose strategy based on --yes flag
-            if getattr(args, 'yes', False) or getattr(args, 'force', False):
+            force = args.force
+            if args.yes or force:
                 strategy = AutoRollbackStrategy()
             else:
                 strategy = InteractiveRollbackStrategy()
@@ -1454,7 +1417,7 @@ class EnvironmentCommands:
             # Execute rollback with strategy
             env.rollback(
                 target=args.target,
-                force=getattr(args, 'force', False),
+                force=force,
                 strategy=strategy
             )
 
@@ -1489,18 +1452,21 @@ class EnvironmentCommands:
 
         print("📋 Analyzing workflows...")
 
-        # Get workflow status (read-only analysis)
         try:
-            workflow_status = env.workflow_manager.get_workflow_status()
+            # Check if there are ANY committable changes (workflows OR git).
+            # This only compares files, so a clean environment skips the
+            # full dependency analysis below.
+            sync_status = env.workflow_manager.get_workflow_sync_status()
+            if not env.has_committable_changes(sync_status):
+                print("✓ No changes to commit")
+                return
+
+            # Get workflow status (read-only analysis), reusing the file scan
+            workflow_status = env.workflow_manager.get_workflow_status(sync_status)
 
             if logger:
                 logger.debug(f"Workflow status: {workflow_status.sync_status}")
 
-            # Check if there are ANY committable changes (workflows OR git)
-            if not env.has_committable_changes():
-                print("✓ No changes to commit")
-                return
-
         except Exception as e:
             if logger:
                 logger.error(f"Workflow analysis failed: {e}", exc_info=True)
@@ -1508,7 +1474,8 @@ class EnvironmentCommands:
             sys.exit(1)
 
         # Check commit safety
-        if not workflow_status.is_commit_safe and not getattr(args, 'allow_issues', False):
+        allow_issues = args.allow_issues
+        if not workflow_status.is_commit_safe and not allow_issues:
             print("\n⚠ Cannot commit - workflows have unresolved issues:\n")
             for wf in workflow_status.workflows_with_issues:
                 print(f"  • {wf.name}: {wf.issue_summary}")
@@ -1523,7 +1490,7 @@ class EnvironmentCommands:
             env.execute_commit(
                 workflow_status=workflow_status,
                 message=args.message,
-                allow_issues=getattr(args, 'allow_issues', False)
+                allow_issues=allow_issues
             )
         except Exception as e:
             if logger:
@@ -1553,17 +1520,14 @@ class EnvironmentCommands:
 
         print(f"🔄 Resetting changes for: {env.name}")
 
-        # Git checkout to reset changes
-        import subprocess
-        cmd = ["git", "checkout", "HEAD", "--", "pyproject.toml"]
-        result = subprocess.run(cmd, cwd=env.cec_path, capture_output=True)
-
-        if result.returncode == 0:
-            print("✓ Changes reset")
-        else:
+        try:
+            env.reset_pyproject()
+        except (OSError, ValueError):
             print("✗ Reset failed", file=sys.stderr)
             sys.exit(1)
 
+        print("✓ Changes reset")
+
     # === Git remote operations ===
 
     @with_env_logging("env pull")
@@ -1572,7 +1536,7 @@ class EnvironmentCommands:
         env = self._get_env(args)
 
         # Check for uncommitted changes first
-        if env.has_committable_changes() and not getattr(args, 'force', False):
+        if env.has_committable_changes() and not args.force:
             print("⚠️  You have uncommitted changes")
             print()
             print("💡 Options:")
@@ -1631,7 +1595,7 @@ class EnvironmentCommands:
             # Pull and repair with progress callbacks
             result = env.pull_and_repair(
                 remote=args.remote,
-                model_strategy=getattr(args, 'models', 'all'),
+                model_strategy=args.models,
                 model_callbacks=model_callbacks,
                 node_callbacks=node_callbacks
             )
@@ -1731,7 +1695,7 @@ class EnvironmentCommands:
             sys.exit(1)
 
         try:
-            force = getattr(args, 'force', False)
+            force = args.force
 
             if force:
                 print(f"📤 Force pushing to {args.remote}...")
@@ -1838,31 +1802,32 @@ class EnvironmentCommands:
             print("No workflows found")
             return
 
-        print(f"Workflows in '{env.name}':")
+        with buffered_stdout():
+            print(f"Workflows in '{env.name}':")
 
-        if workflows.synced:
-            print("\n✓ Synced (up to date):")
-            for name in workflows.synced:
-                print(f"  📋 {name}")
+            if workflows.synced:
+                print("\n✓ Synced (up to date):")
+                for name in workflows.synced:
+                    print(f"  📋 {name}")
 
-        if workflows.modified:
-            print("\n⚠ Modified (changed since last commit):")
-            for name in workflows.modified:
-                print(f"  📝 {name}")
+            if workflows.modified:
+                print("\n⚠ Modified (changed since last commit):")
+                for name in workflows.modified:
+                    print(f"  📝 {name}")
 
-        if workflows.new:
-            print("\n🆕 New (not committed yet):")
-            for name in workflows.new:
-                print(f"  ➕ {name}")
+            if workflows.new:
+                print("\n🆕 New (not committed yet):")
+                for name in workflows.new:
+                    print(f"  ➕ {name}")
 
-        if workflows.deleted:
-            print("\n🗑 Deleted (removed from ComfyUI):")
-            for name in workflows.deleted:
-                print(f"  ➖ {name}")
+            if workflows.deleted:
+                print("\n🗑 Deleted (removed from ComfyUI):")
+                for name in workflows.deleted:
+                    print(f"  ➖ {name}")
 
-        # Show commit suggestion if there are changes
-        if workflows.has_changes:
-            print("\nRun 'cg commit' to save current state")
+            # Show commit suggestion if there are changes
+            if workflows.has_changes:
+                print("\nRun 'cg commit' to save current state")
 
     @with_env_logging("workflow model importance", get_env_name=lambda self, args: self._get_env(args).name)
     def workflow_model_importance(self, args: argparse.Namespace, logger=None) -> None:
@@ -1870,7 +1835,7 @@ class EnvironmentCommands:
         env = self._get_env(args)
 
         # Determine workflow name (direct or interactive)
-        if hasattr(args, 'workflow_name') and args.workflow_name:
+        if getattr(args, 'workflow_name', None):
             workflow_name = args.workflow_name
         else:
             # Interactive: select workflow
@@ -1886,7 +1851,7 @@ class EnvironmentCommands:
             return
 
         # Determine model (direct or interactive)
-        if hasattr(args, 'model_identifier') and args.model_identifier:
+        if getattr(args, 'model_identifier', None):
             # Direct mode: update single model
             model_identifier = args.model_identifier
             new_importance = args.importance
@@ -2048,6 +2013,7 @@ class EnvironmentCommands:
 
         # Phase 2: Check for uninstalled nodes and prompt for installation
         uninstalled_nodes = env.get_uninstalled_nodes(workflow_name=args.name)
+        should_install = False
 
         if uninstalled_nodes:
             print(f"\n📦 Found {len(uninstalled_nodes)} missing node packs:")
@@ -2055,12 +2021,10 @@ class EnvironmentCommands:
                 print(f"  • {node_id}")
 
             # Determine if we should install
-            should_install = False
-
-            if hasattr(args, 'install') and args.install:
+            if getattr(args, 'install', False):
                 # Auto-install mode
                 should_install = True
-            elif hasattr(args, 'no_install') and args.no_install:
+            elif getattr(args, 'no_install', False):
                 # Skip install mode
                 should_install = False
             else:
@@ -2087,7 +2051,6 @@ class EnvironmentCommands:
                     else:
                         # Handle UV-specific errors
                         if "UVCommandError" in str(error) and logger:
-                            from comfygit_core.integrations.uv_command import UVCommandError
                             try:
                                 # Try to extract meaningful error
                                 user_msg = error.split(":", 1)[1].strip() if ":" in error else error
@@ -2126,8 +2089,12 @@ class EnvironmentCommands:
                 # print(f"  • Re-run: cg workflow resolve \"{args.name}\"")
                 # print("  • Or install individually: cg node add <node-id>")
 
-        # Display final results - check issues first
-        uninstalled = env.get_uninstalled_nodes(workflow_name=args.name)
+        # Display final results - check issues first. Installed nodes are
+        # only re-scanned if an install was attempted above.
+        if should_install:
+            uninstalled = env.get_uninstalled_nodes(workflow_name=args.name)
+        else:
+            uninstalled = uninstalled_nodes
 
         if result.has_issues or uninstalled:
             print("\n⚠️  Partial resolution - issues remain:")
@@ -9,7 +9,7 @@ from comfygit_core.core.workspace import Workspace
 from comfygit_core.factories.workspace_factory import WorkspaceFactory
 from comfygit_core.models.protocols import ExportCallbacks, ImportCallbacks
 
-from .cli_utils import get_workspace_or_exit
+from .cli_utils import buffered_stdout, get_workspace_or_exit
 from .logging.environment_logger import WorkspaceLogger, with_workspace_logging
 from .logging.logging_config import get_logger
 from .utils import create_progress_callback, paginate, show_civitai_auth_help, show_download_stats
@@ -87,7 +87,7 @@ class GlobalCommands:
         from pathlib import Path
 
         # Validate models directory if provided (before creating workspace)
-        explicit_models_dir = getattr(args, 'models_dir', None)
+        explicit_models_dir = args.models_dir
         if explicit_models_dir:
             models_path = explicit_models_dir.resolve()
             if not models_path.exists() or not models_path.is_dir():
@@ -98,7 +98,7 @@ class GlobalCommands:
                 args.yes = True
 
         # Determine workspace path
-        path = args.path if (hasattr(args, "path") and args.path) else None
+        path = getattr(args, "path", None) or None
 
         workspace_paths = WorkspaceFactory.get_paths(path)
 
@@ -186,8 +186,8 @@ class GlobalCommands:
         from comfygit_core.utils.common import format_size
 
         # Check for explicit flags
-        use_interactive = not getattr(args, 'yes', False)
-        explicit_models_dir = getattr(args, 'models_dir', None)
+        use_interactive = not args.yes
+        explicit_models_dir = args.models_dir
 
         # If explicit models dir provided via flag (already validated in init)
         if explicit_models_dir:
@@ -317,11 +317,12 @@ class GlobalCommands:
                 print("Create one with: cg create <name>")
                 return
 
-            print("Environments:")
-            for env in environments:
-                marker = "✓" if env.name == active_name else " "
-                status = "(active)" if env.name == active_name else ""
-                print(f"  {marker} {env.name:15} {status}")
+            with buffered_stdout():
+                print("Environments:")
+                for env in environments:
+                    marker = "✓" if env.name == active_name else " "
+                    status = "(active)" if env.name == active_name else ""
+                    print(f"  {marker} {env.name:15} {status}")
 
         except Exception as e:
             logger.error(f"Failed to list environments: {e}")
@@ -336,7 +337,7 @@ class GlobalCommands:
         if args.workspace:
             log_file = self.workspace.paths.logs / "workspace" / "full.log"
             log_source = "workspace"
-        elif hasattr(args, 'target_env') and args.target_env:
+        elif getattr(args, 'target_env', None):
             log_file = self.workspace.paths.logs / args.target_env / "full.log"
             log_source = args.target_env
         else:
@@ -431,7 +432,7 @@ class GlobalCommands:
                 # Check for custom nodes
                 custom_nodes = source_path / "custom_nodes"
                 if custom_nodes.exists():
-                    node_count = len([d for d in custom_nodes.iterdir() if d.is_dir()])
+                    node_count = sum(1 for d in custom_nodes.iterdir() if d.is_dir())
                     print(f"  ✓ Found {node_count} custom nodes")
 
                 # Check for models
@@ -462,7 +463,7 @@ class GlobalCommands:
         if is_git:
             print("📦 Importing environment from git repository")
             print(f"   URL: {args.path}")
-            if hasattr(args, 'branch') and args.branch:
+            if args.branch:
                 print(f"   Branch/Tag: {args.branch}")
             print()
         else:
@@ -474,7 +475,7 @@ class GlobalCommands:
             print()
 
         # Get environment name from args or prompt
-        if hasattr(args, 'name') and args.name:
+        if args.name:
             env_name = args.name
         else:
             env_name = input("Environment name: ").strip()
@@ -616,7 +617,7 @@ class GlobalCommands:
                     git_url=args.path,
                     name=env_name,
                     model_strategy=strategy,
-                    branch=getattr(args, 'branch', None),
+                    branch=args.branch,
                     callbacks=callbacks_instance,
                     torch_backend=args.torch_backend,
                 )
@@ -642,7 +643,7 @@ class GlobalCommands:
                 print("   Environment ready to use!")
 
             # Set as active if --use flag provided
-            if hasattr(args, 'use') and args.use:
+            if args.use:
                 workspace.set_active_environment(env.name)
                 print(f"   '{env.name}' set as active environment")
             else:
@@ -662,7 +663,7 @@ class GlobalCommands:
 
         # Get active environment or from -e flag
         try:
-            if hasattr(args, 'target_env') and args.target_env:
+            if getattr(args, 'target_env', None):
                 env = self.workspace.get_environment(args.target_env)
             else:
                 env = self.workspace.get_active_environment()
@@ -1347,11 +1348,11 @@ class GlobalCommands:
     def config(self, args: argparse.Namespace) -> None:
         """Manage ComfyDock configuration settings."""
         # Flag mode - direct operations
-        if hasattr(args, 'civitai_key') and args.civitai_key is not None:
+        if args.civitai_key is not None:
             self._set_civitai_key(args.civitai_key)
             return
 
-        if hasattr(args, 'show') and args.show:
+        if args.show:
             self._show_config()
             return
 
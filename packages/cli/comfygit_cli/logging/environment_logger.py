@@ -411,7 +411,7 @@ def with_env_logging(command_name: str, get_env_name: Callable | None = None, lo
         command_name: Name of the command for logging (e.g., "env create")
         get_env_name: Optional function to extract env name from args.
                      If None, tries args.name, then args.env_name, 
-                     then calls self._get_env_name(args) if available.
+                     then uses self._get_env(args).name if available.
         log_args: If True, automatically logs all args attributes (default: True)
         **log_context: Additional static context to log
     
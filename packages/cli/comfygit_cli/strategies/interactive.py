@@ -198,9 +198,10 @@ class InteractiveNodeStrategy(NodeResolutionStrategy):
         print(f"\n🔍 Found {len(possible)} matches for '{node_type}':")
         display_count = min(5, len(possible))
         for i, pkg in enumerate(possible[:display_count], 1):
-            display_name = pkg.package_data.display_name if pkg.package_data else pkg.package_id
-            desc = pkg.package_data.description if pkg.package_data else "No description"
-            print(f"  {i}. {display_name or pkg.package_id}")
+            data = pkg.package_data
+            display_name = (data.display_name if data else None) or pkg.package_id
+            desc = data.description if data else "No description"
+            print(f"  {i}. {display_name}")
             if desc and len(desc) > 60:
                 desc = desc[:57] + "..."
             print(f"     {desc}")
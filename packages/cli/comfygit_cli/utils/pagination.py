@@ -3,6 +3,8 @@
 import sys
 from typing import Callable, TypeVar
 
+from ..cli_utils import buffered_stdout
+
 T = TypeVar('T')
 
 
@@ -39,23 +41,25 @@ def paginate(
     current_page = 0
 
     while True:
-        # Clear screen and show header
-        print("\033[2J\033[H", end="")  # Clear screen, move to top
+        # Draw the whole page in one write so it doesn't flicker line by line
+        with buffered_stdout():
+            # Clear screen and show header
+            print("\033[2J\033[H", end="")  # Clear screen, move to top
 
-        if header:
-            print(header)
+            if header:
+                print(header)
 
-        # Calculate page bounds
-        start_idx = current_page * page_size
-        end_idx = min(start_idx + page_size, total_items)
+            # Calculate page bounds
+            start_idx = current_page * page_size
+            end_idx = min(start_idx + page_size, total_items)
 
-        # Display items for current page
-        for item in items[start_idx:end_idx]:
-            render_item(item)
+            # Display items for current page
+            for item in items[start_idx:end_idx]:
+                render_item(item)
 
-        # Display pagination controls
-        print(f"\n{'─' * 60}")
-        print(f"Page {current_page + 1}/{total_pages} (showing {start_idx + 1}-{end_idx} of {total_items})")
+            # Display pagination controls
+            print(f"\n{'─' * 60}")
+            print(f"Page {current_page + 1}/{total_pages} (showing {start_idx + 1}-{end_idx} of {total_items})")
 
         # Build prompt based on available navigation
         options = []
@@ -0,0 +1,29 @@
+"""Tests for buffered_stdout report batching."""
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from comfygit_cli.cli_utils import buffered_stdout
+
+
+def test_block_output_written_once(monkeypatch):
+    """All prints in the block reach stdout as a single write."""
+    fake_stdout = MagicMock()
+    monkeypatch.setattr(sys, 'stdout', fake_stdout)
+
+    with buffered_stdout():
+        print("Environment: test")
+        print("\n📋 Workflows:")
+        print("  ✓ default")
+
+    fake_stdout.write.assert_called_once_with("Environment: test\n\n📋 Workflows:\n  ✓ default\n")
+
+
+def test_output_flushed_on_exit(capsys):
+    """Output printed before sys.exit inside the block is not lost."""
+    with pytest.raises(SystemExit):
+        with buffered_stdout():
+            print("partial report")
+            sys.exit(1)
+
+    assert capsys.readouterr().out == "partial report\n"
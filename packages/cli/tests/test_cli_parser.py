@@ -0,0 +1,121 @@
+"""Tests for command peeking, parser narrowing and lazy dispatch in cli.main."""
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from comfygit_cli import cli
+
+
+@pytest.fixture
+def fake_env_commands(monkeypatch):
+    """Stand-in EnvironmentCommands instance for dispatch, without workspace setup."""
+    handler = MagicMock()
+    monkeypatch.setitem(cli._HANDLER_INSTANCES, "env_commands", handler)
+    monkeypatch.setattr(cli, "_check_for_old_docker_installation", lambda: None)
+    monkeypatch.setattr(cli, "_configure_logging", lambda: None)
+    return handler
+
+
+class TestPeekCommand:
+    """_peek_command must find the command wherever argparse would."""
+
+    @pytest.mark.parametrize("argv", [
+        ["status"],
+        ["-v", "status"],
+        ["-e", "foo", "status"],
+        ["--env", "foo", "status"],
+        ["--en", "foo", "status"],
+        ["--e", "foo", "status"],
+        ["--env=foo", "status"],
+        ["--en=foo", "status"],
+        ["-efoo", "status"],
+        ["-ve", "foo", "status"],
+        ["-vefoo", "status"],
+        ["-e", "foo", "-v", "status", "--help"],
+    ])
+    def test_command_after_global_options(self, argv):
+        assert cli._peek_command(argv) == "status"
+
+    @pytest.mark.parametrize("argv", [
+        [], ["-h"], ["--help"], ["--he"], ["-vh"], ["-e", "foo"], ["-ve", "foo"], ["-v"],
+    ])
+    def test_no_command(self, argv):
+        assert cli._peek_command(argv) is None
+
+
+class TestCreateParser:
+    """Narrowed parsers must parse the dispatched command like the full parser."""
+
+    def test_narrowed_parse_matches_full_parse(self):
+        argv = ["-e", "foo", "node", "add", "comfyui-foo", "--dev"]
+
+        narrowed = cli.create_parser("node").parse_args(argv)
+        full = cli.create_parser().parse_args(argv)
+
+        assert vars(narrowed) == vars(full)
+        assert narrowed.target_env == "foo"
+
+    def test_narrowed_parser_lists_every_command(self, capsys):
+        with pytest.raises(SystemExit):
+            cli.create_parser("status").parse_args(["--help"])
+
+        out = capsys.readouterr().out
+        for name in cli._COMMANDS:
+            assert name in out
+
+    @pytest.mark.parametrize("argv, argument", [
+        (["bogus"], "argument command: invalid choice: 'bogus'"),
+        (["node", "bogus"], "argument node_command: invalid choice: 'bogus'"),
+    ])
+    def test_invalid_choice_names_command_argument(self, capsys, argv, argument):
+        with pytest.raises(SystemExit):
+            cli.create_parser(argv[0], names_only=argv[0] not in cli._COMMANDS).parse_args(argv)
+
+        assert argument in capsys.readouterr().err
+
+    def test_names_only_parser_has_no_handlers(self):
+        args = cli.create_parser(names_only=True).parse_args(["status"])
+
+        assert not hasattr(args, "func")
+
+
+class TestMainDispatch:
+    """main() peeks the command, builds the narrowed parser and dispatches lazily."""
+
+    @pytest.mark.parametrize("env_args", [
+        ["-e", "foo"], ["--env", "foo"], ["--en", "foo"], ["--env=foo"], ["-ve", "foo"],
+    ])
+    def test_env_option_spellings_dispatch_command(self, monkeypatch, fake_env_commands, env_args):
+        monkeypatch.setattr(sys, "argv", ["cg", *env_args, "status"])
+
+        cli.main()
+
+        fake_env_commands.status.assert_called_once()
+        args = fake_env_commands.status.call_args.args[0]
+        assert args.target_env == "foo"
+
+    def test_unrecognized_peek_falls_back_to_full_parser(self, monkeypatch, fake_env_commands):
+        """A token the peek takes for a command but isn't one still dispatches."""
+        monkeypatch.setattr(cli, "_peek_command", lambda argv: "foo")
+        monkeypatch.setattr(sys, "argv", ["cg", "-e", "foo", "status"])
+
+        cli.main()
+
+        fake_env_commands.status.assert_called_once()
+
+    def test_run_passes_unknown_args_through(self, monkeypatch, fake_env_commands):
+        monkeypatch.setattr(sys, "argv", ["cg", "run", "--listen", "0.0.0.0"])
+
+        cli.main()
+
+        args = fake_env_commands.run.call_args.args[0]
+        assert args.args == ["--listen", "0.0.0.0"]
+
+    def test_unknown_args_rejected(self, monkeypatch, fake_env_commands):
+        monkeypatch.setattr(sys, "argv", ["cg", "status", "--bogus"])
+
+        with pytest.raises(SystemExit) as exc:
+            cli.main()
+
+        assert exc.value.code == 2
+        fake_env_commands.status.assert_not_called()
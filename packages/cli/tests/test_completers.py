@@ -37,7 +37,7 @@ class TestSharedUtilities:
         result = filter_by_prefix(items, "xyz")
         assert result == []
 
-    @patch('comfygit_cli.completers.WorkspaceFactory.find')
+    @patch('comfygit_core.factories.workspace_factory.WorkspaceFactory.find')
     def test_get_workspace_safe_success(self, mock_find):
         """Test getting workspace successfully."""
         mock_workspace = Mock()
@@ -46,7 +46,7 @@ class TestSharedUtilities:
         result = get_workspace_safe()
         assert result == mock_workspace
 
-    @patch('comfygit_cli.completers.WorkspaceFactory.find')
+    @patch('comfygit_core.factories.workspace_factory.WorkspaceFactory.find')
     def test_get_workspace_safe_not_found(self, mock_find):
         """Test get_workspace_safe returns None when not found."""
         mock_find.side_effect = CDWorkspaceNotFoundError("Not found")
@@ -0,0 +1,69 @@
+"""Tests for environment resolution in EnvironmentCommands._get_env."""
+from argparse import Namespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from comfygit_cli.env_commands import EnvironmentCommands
+
+
+class TestGetEnvCache:
+    """Environment lookups should happen once per command invocation."""
+
+    @patch('comfygit_cli.env_commands.get_workspace_or_exit')
+    def test_target_env_resolved_once(self, mock_workspace):
+        """Repeated -e lookups reuse the first resolved environment."""
+        mock_env = MagicMock()
+        mock_workspace.return_value.get_environment.return_value = mock_env
+
+        cmd = EnvironmentCommands()
+        args = Namespace(target_env="test-env")
+
+        assert cmd._get_env(args) is mock_env
+        assert cmd._get_env(args) is mock_env
+        mock_workspace.return_value.get_environment.assert_called_once_with("test-env")
+
+    @patch('comfygit_cli.env_commands.get_workspace_or_exit')
+    def test_active_env_resolved_once(self, mock_workspace):
+        """Repeated active-environment lookups reuse the first result."""
+        mock_env = MagicMock()
+        mock_workspace.return_value.get_active_environment.return_value = mock_env
+
+        cmd = EnvironmentCommands()
+        args = Namespace(target_env=None)
+
+        assert cmd._get_env(args) is mock_env
+        assert cmd._get_env(args) is mock_env
+        mock_workspace.return_value.get_active_environment.assert_called_once()
+
+    @patch('comfygit_cli.env_commands.get_workspace_or_exit')
+    def test_different_targets_cached_separately(self, mock_workspace):
+        """An explicit -e target doesn't reuse the active environment."""
+        active_env = MagicMock()
+        target_env = MagicMock()
+        mock_workspace.return_value.get_active_environment.return_value = active_env
+        mock_workspace.return_value.get_environment.return_value = target_env
+
+        cmd = EnvironmentCommands()
+
+        assert cmd._get_env(Namespace(target_env=None)) is active_env
+        assert cmd._get_env(Namespace(target_env="other")) is target_env
+
+    @patch('comfygit_cli.env_commands.get_workspace_or_exit')
+    def test_unknown_target_suggests_close_matches(self, mock_workspace, capsys):
+        """An unknown -e name lists environments once and suggests near misses."""
+        names = ["production", "prod-test", "sandbox"]
+        envs = [MagicMock() for _ in names]
+        for env, name in zip(envs, names, strict=True):
+            env.name = name
+        mock_workspace.return_value.get_environment.side_effect = KeyError("prodction")
+        mock_workspace.return_value.list_environments.return_value = envs
+
+        cmd = EnvironmentCommands()
+
+        with pytest.raises(SystemExit):
+            cmd._get_env(Namespace(target_env="prodction"))
+
+        out = capsys.readouterr().out
+        assert "Did you mean: production" in out
+        assert "  • sandbox" in out
+        mock_workspace.return_value.list_environments.assert_called_once()
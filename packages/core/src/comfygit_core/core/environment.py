@@ -574,8 +574,9 @@ class Environment:
         # 1. Check for ALL uncommitted changes (both git and workflows)
         if not force:
             has_git_changes = self.git_manager.has_uncommitted_changes()
-            status = self.status()
-            has_workflow_changes = status.workflow.sync_status.has_changes
+            # File-level workflow sync is all we need; a full status() would
+            # also scan packages/nodes, analyze workflows and detect models
+            has_workflow_changes = self.workflow_manager.get_workflow_sync_status().has_changes
 
             if has_git_changes or has_workflow_changes:
                 # Changes detected - need confirmation or force
@@ -635,16 +636,25 @@ class Environment:
         else:
             logger.info(f"Rollback complete: already at {target_version} (no changes)")
 
-    def get_versions(self, limit: int = 10) -> list[dict]:
+    def reset_pyproject(self) -> None:
+        """Discard uncommitted changes to pyproject.toml.
+
+        Raises:
+            OSError: If the git checkout fails
+        """
+        self.git_manager.discard_pyproject_changes()
+
+    def get_versions(self, limit: int = 10, newest_first: bool = False) -> list[dict]:
         """Get simplified version history for this environment.
 
         Args:
             limit: Maximum number of versions to return
+            newest_first: Return the newest version first instead of oldest first
 
         Returns:
             List of version info dicts with keys: version, hash, message, date
         """
-        return self.git_manager.get_version_history(limit)
+        return self.git_manager.get_version_history(limit, newest_first=newest_first)
 
     def sync_model_paths(self) -> dict | None:
         """Ensure model symlink is configured for this environment.
@@ -1019,18 +1029,25 @@ class Environment:
         node_ids = [node.registry_id or node.name for node in unused]
         return self.remove_nodes_with_progress(node_ids, callbacks)
 
-    def has_committable_changes(self) -> bool:
+    def has_committable_changes(
+        self, sync_status: WorkflowSyncStatus | None = None
+    ) -> bool:
         """Check if there are any committable changes (workflows OR git).
 
         This is the clean API for determining if a commit is possible.
         Checks both workflow file sync status AND git uncommitted changes.
 
+        Args:
+            sync_status: Already computed workflow file sync status to reuse
+
         Returns:
             True if there are committable changes, False otherwise
         """
-        # Check workflow file changes (new/modified/deleted workflows)
-        workflow_status = self.workflow_manager.get_workflow_status()
-        has_workflow_changes = workflow_status.sync_status.has_changes
+        # Check workflow file changes (new/modified/deleted workflows).
+        # Only file sync state matters here, so skip the full analysis.
+        if sync_status is None:
+            sync_status = self.workflow_manager.get_workflow_sync_status()
+        has_workflow_changes = sync_status.has_changes
 
         # Check git uncommitted changes (pyproject.toml, uv.lock, etc.)
         has_git_changes = self.git_manager.has_uncommitted_changes()
@@ -1104,7 +1121,7 @@ class Environment:
 
         logger.info("Copying workflows from ComfyUI to .cec...")
         copy_results = self.workflow_manager.copy_all_workflows()
-        copied_count = len([r for r in copy_results.values() if r and r != "deleted"])
+        copied_count = sum(1 for r in copy_results.values() if r and r != "deleted")
         logger.debug(f"Copied {copied_count} workflow(s)")
 
         self.commit(message)
@@ -1198,20 +1215,17 @@ class Environment:
         Returns:
             List of ModelSourceStatus objects with model and local availability
         """
-        all_models = self.pyproject.models.get_all()
+        models_without_sources = [m for m in self.pyproject.models.get_all() if not m.sources]
 
-        results = []
-        for model in all_models:
-            if not model.sources:
-                # Check if model exists in local index
-                local_model = self.model_repository.get_model(model.hash)
-
-                results.append(ModelSourceStatus(
-                    model=model,
-                    available_locally=local_model is not None
-                ))
+        # Check local index availability for all of them at once
+        local_models = self.model_repository.get_models_by_hashes(
+            m.hash for m in models_without_sources
+        )
 
-        return results
+        return [
+            ModelSourceStatus(model=model, available_locally=model.hash in local_models)
+            for model in models_without_sources
+        ]
 
     # =====================================================
     # Constraint Management
@@ -1225,6 +1239,28 @@ class Environment:
         """Remove a constraint dependency."""
         return self.pyproject.uv_config.remove_constraint(package)
 
+    def add_constraints(self, packages: list[str]) -> None:
+        """Add several constraint dependencies with a single pyproject write."""
+        config = self.pyproject.load()
+        for package in packages:
+            self.pyproject.uv_config.add_constraint(package, config=config)
+        self.pyproject.save(config)
+
+    def remove_constraints(self, packages: list[str]) -> list[str]:
+        """Remove several constraint dependencies with a single pyproject write.
+
+        Returns:
+            The packages that had a constraint and were removed
+        """
+        config = self.pyproject.load()
+        removed = [
+            package for package in packages
+            if self.pyproject.uv_config.remove_constraint(package, config=config)
+        ]
+        if removed:
+            self.pyproject.save(config)
+        return removed
+
     def list_constraints(self) -> list[str]:
         """List constraint dependencies."""
         return self.pyproject.uv_config.get_constraints()
@@ -1524,18 +1560,28 @@ class Environment:
 
         missing_by_hash: dict[str, MissingModelInfo] = {}
 
-        # First pass: Check all workflow models for missing resolved models
         all_workflows = self.pyproject.workflows.get_all_with_resolutions()
-        for workflow_name in all_workflows.keys():
-            workflow_models = self.pyproject.workflows.get_workflow_models(workflow_name)
+        models_by_workflow = {
+            workflow_name: self.pyproject.workflows.get_workflow_models(workflow_name)
+            for workflow_name in all_workflows
+        }
+        global_models = self.pyproject.models.get_all()
+
+        # Resolve every referenced hash against the index in one bulk lookup.
+        # Only models with a valid location are returned (file deleted = absent)
+        present = self.model_repository.get_models_by_hashes(
+            [wf_model.hash for models in models_by_workflow.values() for wf_model in models]
+            + [global_model.hash for global_model in global_models]
+        )
 
+        # First pass: Check all workflow models for missing resolved models
+        for workflow_name, workflow_models in models_by_workflow.items():
             for wf_model in workflow_models:
                 # Check both resolved models and models that reference a filename
                 model_hash = wf_model.hash
 
                 # If model has a hash, check if it exists WITH a valid location
-                # get_model() returns None if model has no locations (file deleted)
-                if model_hash and not self.model_repository.get_model(model_hash):
+                if model_hash and model_hash not in present:
                     # Model is missing!
                     if model_hash not in missing_by_hash:
                         # Get global model entry
@@ -1560,17 +1606,15 @@ class Environment:
 
         # Second pass: Check global models table for any models not in repository
         # This catches models that were resolved but file was deleted
-        global_models = self.pyproject.models.get_all()
         for global_model in global_models:
             if global_model.hash not in missing_by_hash:
                 # Check if this model exists in repository WITH a valid location
-                if not self.model_repository.get_model(global_model.hash):
+                if global_model.hash not in present:
                     # Find which workflows use this model
                     workflows_using_model = []
                     criticality = "flexible"  # Default
 
-                    for workflow_name in all_workflows.keys():
-                        workflow_models = self.pyproject.workflows.get_workflow_models(workflow_name)
+                    for workflow_name, workflow_models in models_by_workflow.items():
                         for wf_model in workflow_models:
                             if wf_model.hash == global_model.hash:
                                 workflows_using_model.append(workflow_name)
@@ -1614,6 +1658,10 @@ class Environment:
 
         workflows_with_intents = []
 
+        # Local availability per hash; models shared between workflows are
+        # looked up (and their sources enriched) only once
+        locally_available: dict[str, bool] = {}
+
         # Get all workflows from pyproject
         all_workflows = self.pyproject.workflows.get_all_with_resolutions()
 
@@ -1627,8 +1675,12 @@ class Environment:
                     continue
 
                 # Check if model exists locally
-                if model.hash:
+                if model.hash in locally_available:
+                    if locally_available[model.hash]:
+                        continue
+                elif model.hash:
                     existing = self.model_repository.get_model(model.hash)
+                    locally_available[model.hash] = existing is not None
                     if existing:
                         # Model exists - enrich SQLite with sources from pyproject
                         global_model = self.pyproject.models.get_by_hash(model.hash)
@@ -17,12 +17,12 @@ if TYPE_CHECKING:
     from .pyproject_manager import PyprojectManager
 
 from ..utils.git import (
-    get_uncommitted_changes,
     git_checkout,
     git_commit,
     git_config_get,
     git_config_set,
     git_diff,
+    git_has_uncommitted_changes,
     git_history,
     git_init,
     git_ls_files,
@@ -254,19 +254,25 @@ __pycache__/
         logger.info("Discarding uncommitted changes")
         git_checkout(self.repo_path, "HEAD", files=["."])
 
-    def get_version_history(self, limit: int = 10) -> list[dict]:
+    def discard_pyproject_changes(self) -> None:
+        """Discard uncommitted changes to pyproject.toml only."""
+        logger.info("Discarding uncommitted pyproject.toml changes")
+        git_checkout(self.repo_path, "HEAD", files=["pyproject.toml"])
+
+    def get_version_history(self, limit: int = 10, newest_first: bool = False) -> list[dict]:
         """Get simplified version history with v1, v2 labels.
 
         Args:
             limit: DEPRECATED - Now always shows all commits for version stability.
                    Parameter kept for API compatibility but is ignored.
+            newest_first: Return the newest version first instead of oldest first
 
         Returns:
             List of version info dicts with stable version numbers
         """
         # Always get ALL commits to ensure version numbers remain stable
         # Pagination can be added post-MVP if needed
-        return self._get_commit_versions(limit=1000)
+        return self._get_commit_versions(limit=1000, newest_first=newest_first)
 
     def resolve_version(self, version: str) -> str:
         """Resolve a version identifier to a commit hash.
@@ -358,20 +364,21 @@ __pycache__/
         Returns:
             True if there are uncommitted changes
         """
-        return bool(get_uncommitted_changes(self.repo_path))
+        return git_has_uncommitted_changes(self.repo_path)
 
     def _create_gitignore(self) -> None:
         """Create standard .gitignore for environment tracking."""
         gitignore_path = self.repo_path / ".gitignore"
         gitignore_path.write_text(self.gitignore_content)
 
-    def _get_commit_versions(self, limit: int = 10) -> list[dict]:
+    def _get_commit_versions(self, limit: int = 10, newest_first: bool = False) -> list[dict]:
         """Get simplified version list from git history.
 
         Returns commits with simple identifiers instead of full hashes.
 
         Args:
             limit: Maximum number of commits to return
+            newest_first: Keep git's newest-first order instead of chronological
 
         Returns:
             List of commit info dicts with keys: version, hash, message, date
@@ -391,12 +398,15 @@ __pycache__/
                     'date': date
                 })
 
-        # Reverse so oldest commit is first (chronological order)
-        commits.reverse()
-
-        # Now assign version numbers: oldest = v1, newest = v<highest>
+        # Assign version numbers: oldest = v1, newest = v<highest>
+        # (git log lists newest first)
+        total = len(commits)
         for i, commit in enumerate(commits):
-            commit['version'] = f"v{i + 1}"
+            commit['version'] = f"v{total - i}"
+
+        if not newest_first:
+            # Reverse so oldest commit is first (chronological order)
+            commits.reverse()
 
         return commits
 
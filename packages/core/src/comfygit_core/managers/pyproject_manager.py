@@ -427,10 +427,12 @@ class DependencyHandler(BaseHandler):
             config['dependency-groups'][group] = []
 
         group_deps = config['dependency-groups'][group]
+        existing = set(group_deps)
         added_count = 0
 
         for pkg in packages:
-            if pkg not in group_deps:
+            if pkg not in existing:
+                existing.add(pkg)
                 group_deps.append(pkg)
                 added_count += 1
 
@@ -522,9 +524,16 @@ class UVConfigHandler(BaseHandler):
     # System-level sources that should never be auto-removed
     PROTECTED_SOURCES = {'pytorch-cuda', 'pytorch-cpu', 'torch-cpu', 'torch-cuda'}
 
-    def add_constraint(self, package: str) -> None:
-        """Add a constraint dependency to [tool.uv]."""
-        config = self.load()
+    def add_constraint(self, package: str, config: dict | None = None) -> None:
+        """Add a constraint dependency to [tool.uv].
+
+        Args:
+            package: Package specification (e.g., "torch==2.4.1")
+            config: Optional in-memory config for batched writes. If None, loads and saves immediately.
+        """
+        is_batch = config is not None
+        if not is_batch:
+            config = self.load()
         self.ensure_section(config, 'tool', 'uv')
 
         constraints = config['tool']['uv'].get('constraint-dependencies', [])
@@ -543,11 +552,19 @@ class UVConfigHandler(BaseHandler):
             constraints.append(package)
 
         config['tool']['uv']['constraint-dependencies'] = constraints
-        self.save(config)
+        if not is_batch:
+            self.save(config)
 
-    def remove_constraint(self, package_name: str) -> bool:
-        """Remove a constraint dependency from [tool.uv]."""
-        config = self.load()
+    def remove_constraint(self, package_name: str, config: dict | None = None) -> bool:
+        """Remove a constraint dependency from [tool.uv].
+
+        Args:
+            package_name: Name of the constrained package
+            config: Optional in-memory config for batched writes. If None, loads and saves immediately.
+        """
+        is_batch = config is not None
+        if not is_batch:
+            config = self.load()
         constraints = config.get('tool', {}).get('uv', {}).get('constraint-dependencies', [])
 
         if not constraints:
@@ -559,7 +576,8 @@ class UVConfigHandler(BaseHandler):
                 removed = constraints.pop(i)
                 logger.info(f"Removing constraint: {removed}")
                 config['tool']['uv']['constraint-dependencies'] = constraints
-                self.save(config)
+                if not is_batch:
+                    self.save(config)
                 return True
 
         return False
@@ -549,17 +549,23 @@ class WorkflowManager:
             uninstalled_nodes=uninstalled_nodes
         )
 
-    def get_workflow_status(self) -> DetailedWorkflowStatus:
+    def get_workflow_status(
+        self, sync_status: WorkflowSyncStatus | None = None
+    ) -> DetailedWorkflowStatus:
         """Get detailed workflow status with full dependency analysis.
 
         Analyzes ALL workflows in ComfyUI directory, checking dependencies
         and resolution status. This is read-only - no copying to .cec.
 
+        Args:
+            sync_status: Already computed file sync status to reuse
+
         Returns:
             DetailedWorkflowStatus with sync status and analysis for each workflow
         """
         # Step 1: Get file sync status (fast)
-        sync_status = self.get_workflow_sync_status()
+        if sync_status is None:
+            sync_status = self.get_workflow_sync_status()
 
         # Step 2: Pre-load pyproject data once for all workflows
         workflows_config = self.pyproject.workflows.get_all_with_resolutions()
@@ -1132,6 +1138,9 @@ class WorkflowManager:
                 )
                 manifest_models.append(manifest_model)
 
+        # Fetch sources for all resolved models at once to enrich global table
+        sources_by_hash = self.model_repository.get_sources_by_hashes(hash_to_refs)
+
         # Create manifest entries for resolved models
         for model_hash, refs in hash_to_refs.items():
             # Get model from first resolved entry
@@ -1145,9 +1154,7 @@ class WorkflowManager:
             # Determine criticality with smart defaults
             criticality = self._get_default_criticality(model.category)
 
-            # Fetch sources from repository to enrich global table
-            sources_from_repo = self.model_repository.get_sources(model.hash)
-            sources = [s['url'] for s in sources_from_repo]
+            sources = [s['url'] for s in sources_by_hash.get(model.hash, [])]
 
             # Workflow model: lightweight reference (no sources - hash is the key)
             manifest_model = ManifestWorkflowModel(
@@ -10,6 +10,25 @@ from .workflow import DetailedWorkflowStatus
 if TYPE_CHECKING:
     from .manifest import ManifestModel
 
+# Git status of a workflow file -> verb used in change summaries
+_WORKFLOW_CHANGE_VERBS = {"modified": "Update", "added": "Add", "deleted": "Remove"}
+
+
+def _summarize_added_removed(added: list[dict], removed: list[dict], label: str) -> str | None:
+    """Describe added/removed items in one commit message phrase.
+
+    A single item is named; several are counted. Items are dicts with a
+    "name" key, as in GitStatus.nodes_added.
+    """
+    if added and removed:
+        return f"Update {label}: +{len(added)}, -{len(removed)}"
+    for verb, items in (("Add", added), ("Remove", removed)):
+        if len(items) == 1:
+            return f"{verb} {items[0]['name']}"
+        if items:
+            return f"{verb} {len(items)} {label}"
+    return None
+
 
 @dataclass
 class PackageSyncStatus:
@@ -191,20 +210,11 @@ class EnvironmentStatus:
         secondary_changes = []
 
         # Node changes (most specific)
-        if self.git.nodes_added and self.git.nodes_removed:
-            primary_changes.append(
-                f"Update nodes: +{len(self.git.nodes_added)}, -{len(self.git.nodes_removed)}"
-            )
-        elif self.git.nodes_added:
-            if len(self.git.nodes_added) == 1:
-                primary_changes.append(f"Add {self.git.nodes_added[0]['name']}")
-            else:
-                primary_changes.append(f"Add {len(self.git.nodes_added)} nodes")
-        elif self.git.nodes_removed:
-            if len(self.git.nodes_removed) == 1:
-                primary_changes.append(f"Remove {self.git.nodes_removed[0]['name']}")
-            else:
-                primary_changes.append(f"Remove {len(self.git.nodes_removed)} nodes")
+        node_change = _summarize_added_removed(
+            self.git.nodes_added, self.git.nodes_removed, "nodes"
+        )
+        if node_change:
+            primary_changes.append(node_change)
 
         # Dependency changes
         if (
@@ -232,12 +242,9 @@ class EnvironmentStatus:
                 workflow_name, workflow_status = list(
                     self.git.workflow_changes.items()
                 )[0]
-                if workflow_status == "modified":
-                    primary_changes.append(f"Update {workflow_name}")
-                elif workflow_status == "added":
-                    primary_changes.append(f"Add {workflow_name}")
-                elif workflow_status == "deleted":
-                    primary_changes.append(f"Remove {workflow_name}")
+                verb = _WORKFLOW_CHANGE_VERBS.get(workflow_status)
+                if verb:
+                    primary_changes.append(f"{verb} {workflow_name}")
             else:
                 primary_changes.append(f"Update {workflow_count} workflows")
 
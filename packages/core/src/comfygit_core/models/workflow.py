@@ -759,7 +759,7 @@ class CommitAnalysis:
     @property
     def summary(self) -> str:
         """Generate commit summary."""
-        copied_count = len([s for s in self.workflows_copied.values() if s == "copied"])
+        copied_count = sum(1 for s in self.workflows_copied.values() if s == "copied")
         if copied_count:
             return f"Update {copied_count} workflow(s)"
         return "Update workflows"
@@ -1,6 +1,7 @@
 """ModelIndexManager - Model-specific database operations and schema management."""
 
 import json
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 
@@ -114,6 +115,11 @@ class ModelRepository:
 
     def ensure_schema(self) -> None:
         """Create database schema if needed."""
+        # An up-to-date database already has every table and index, so skip
+        # the idempotent CREATE statements (one connection each) on startup
+        if self._has_current_schema():
+            return
+
         self.sqlite.create_table(CREATE_MODELS_TABLE)
         self.sqlite.create_table(CREATE_MODEL_LOCATIONS_TABLE)
         self.sqlite.create_table(CREATE_MODEL_SOURCES_TABLE)
@@ -131,6 +137,16 @@ class ModelRepository:
         if current_version != SCHEMA_VERSION:
             self.migrate_schema(current_version, SCHEMA_VERSION)
 
+    def _has_current_schema(self) -> bool:
+        """Check if the database already records the current schema version."""
+        tables = self.sqlite.execute_query(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_info'"
+        )
+        if not tables:
+            return False
+        results = self.sqlite.execute_query("SELECT version FROM schema_info LIMIT 1")
+        return bool(results) and results[0]['version'] == SCHEMA_VERSION
+
     def get_schema_version(self) -> int:
         """Get current schema version from database.
 
@@ -250,6 +266,59 @@ class ModelRepository:
         result = self.find_model_by_hash(hash)
         return result[0] if result else None
         
+    def get_models_by_hashes(self, hashes: Iterable[str]) -> dict[str, ModelWithLocation]:
+        """Get models for many exact hashes with one query per batch.
+
+        Unlike get_model(), hashes are matched exactly against the short
+        hash (no prefix or blake3/sha256 matching), which lets SQLite use
+        the primary key instead of scanning the table once per model.
+
+        Args:
+            hashes: Short model hashes to look up
+
+        Returns:
+            Dict of hash -> first ModelWithLocation in the current directory.
+            Hashes without an indexed location are absent.
+        """
+        unique_hashes = list(dict.fromkeys(h for h in hashes if h))
+        found: dict[str, ModelWithLocation] = {}
+
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(unique_hashes), 500):
+            batch = unique_hashes[start:start + 500]
+            placeholders = ", ".join("?" * len(batch))
+            query = f"""
+            SELECT m.hash, m.file_size, m.blake3_hash, m.sha256_hash, m.metadata,
+                   l.base_directory, l.relative_path, l.filename, l.mtime, l.last_seen
+            FROM models m
+            JOIN model_locations l ON m.hash = l.model_hash
+            WHERE m.hash IN ({placeholders})
+            """
+            params: tuple = tuple(batch)
+            if self.current_directory:
+                query += " AND l.base_directory = ?"
+                params += (str(self.current_directory.resolve()),)
+            query += " ORDER BY l.relative_path"
+
+            for row in self.sqlite.execute_query(query, params):
+                if row['hash'] in found:
+                    continue
+                metadata = json.loads(row['metadata']) if row['metadata'] else {}
+                found[row['hash']] = ModelWithLocation(
+                    hash=row['hash'],
+                    file_size=row['file_size'],
+                    blake3_hash=row['blake3_hash'],
+                    sha256_hash=row['sha256_hash'],
+                    relative_path=row['relative_path'],
+                    filename=row['filename'],
+                    mtime=row['mtime'],
+                    last_seen=row['last_seen'],
+                    base_directory=row.get('base_directory'),
+                    metadata=metadata
+                )
+
+        return found
+
     def has_model(self, hash: str) -> bool:
         """Check if model exists by hash.
 
@@ -401,31 +470,41 @@ class ModelRepository:
         if base_directory == "USE_CURRENT":
             base_directory = self.current_directory
 
-        # Support both exact match and prefix matching
+        # Support both exact match and prefix matching. A half-open range
+        # [prefix, prefix + U+FFFF) is a prefix match that, unlike LIKE, can
+        # use the hash, blake3 and sha256 indexes. The range is case-sensitive
+        # and hashes are stored as lowercase hex, so lowercase the query to
+        # keep LIKE's case-insensitive matching. CROSS JOIN keeps SQLite from
+        # reordering the join to scan every location first.
+        hash_query = hash_query.lower()
+        bounds = (hash_query, hash_query + "\uffff")
+        hash_filter = """
+            ((m.hash >= ? AND m.hash < ?)
+             OR (m.blake3_hash >= ? AND m.blake3_hash < ?)
+             OR (m.sha256_hash >= ? AND m.sha256_hash < ?))
+            """
         if base_directory:
             base_dir_str = str(base_directory.resolve())
-            query = """
+            query = f"""
             SELECT m.hash, m.file_size, m.blake3_hash, m.sha256_hash, m.metadata,
                    l.base_directory, l.relative_path, l.filename, l.mtime, l.last_seen
             FROM models m
-            JOIN model_locations l ON m.hash = l.model_hash
-            WHERE (m.hash LIKE ? OR m.blake3_hash LIKE ? OR m.sha256_hash LIKE ?)
+            CROSS JOIN model_locations l ON m.hash = l.model_hash
+            WHERE {hash_filter}
               AND l.base_directory = ?
             ORDER BY l.relative_path
             """
-            search_pattern = f"{hash_query}%"
-            results = self.sqlite.execute_query(query, (search_pattern, search_pattern, search_pattern, base_dir_str))
+            results = self.sqlite.execute_query(query, bounds * 3 + (base_dir_str,))
         else:
-            query = """
+            query = f"""
             SELECT m.hash, m.file_size, m.blake3_hash, m.sha256_hash, m.metadata,
                    l.base_directory, l.relative_path, l.filename, l.mtime, l.last_seen
             FROM models m
-            JOIN model_locations l ON m.hash = l.model_hash
-            WHERE m.hash LIKE ? OR m.blake3_hash LIKE ? OR m.sha256_hash LIKE ?
+            CROSS JOIN model_locations l ON m.hash = l.model_hash
+            WHERE {hash_filter}
             ORDER BY l.relative_path
             """
-            search_pattern = f"{hash_query}%"
-            results = self.sqlite.execute_query(query, (search_pattern, search_pattern, search_pattern))
+            results = self.sqlite.execute_query(query, bounds * 3)
 
         models = []
         for row in results:
@@ -533,6 +612,41 @@ class ModelRepository:
 
         return sources
 
+    def get_sources_by_hashes(self, hashes: Iterable[str]) -> dict[str, list[dict]]:
+        """Get download sources for many models with one query per batch.
+
+        Args:
+            hashes: Hashes of models to get sources for
+
+        Returns:
+            Dict of hash -> source dictionaries (same shape and order as
+            get_sources()). Hashes without sources are absent.
+        """
+        unique_hashes = list(dict.fromkeys(h for h in hashes if h))
+        sources: dict[str, list[dict]] = {}
+
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(unique_hashes), 500):
+            batch = unique_hashes[start:start + 500]
+            placeholders = ", ".join("?" * len(batch))
+            query = f"""
+            SELECT model_hash, source_type, source_url, metadata, added_time
+            FROM model_sources
+            WHERE model_hash IN ({placeholders})
+            ORDER BY added_time DESC
+            """
+
+            for row in self.sqlite.execute_query(query, tuple(batch)):
+                metadata = json.loads(row['metadata']) if row['metadata'] else {}
+                sources.setdefault(row['model_hash'], []).append({
+                    'type': row['source_type'],
+                    'url': row['source_url'],
+                    'metadata': metadata,
+                    'added_time': row['added_time']
+                })
+
+        return sources
+
     def add_source(self, model_hash: str, source_type: str, source_url: str, metadata: dict | None = None) -> None:
         """Add a download source for a model.
 
@@ -1,6 +1,7 @@
 """Import preview and analysis service."""
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -124,6 +125,8 @@ class ImportAnalyzer:
         # Analyze workflows
         workflows = self._analyze_workflows(pyproject_data)
 
+        node_sources = Counter(n.source for n in nodes)
+
         # Build summary
         return ImportAnalysis(
             comfyui_version=comfygit_config.get("comfyui_version"),
@@ -137,9 +140,9 @@ class ImportAnalyzer:
             ),
             nodes=nodes,
             total_nodes=len(nodes),
-            registry_nodes=sum(1 for n in nodes if n.source == "registry"),
+            registry_nodes=node_sources["registry"],
             dev_nodes=sum(1 for n in nodes if n.is_dev_node),
-            git_nodes=sum(1 for n in nodes if n.source == "git"),
+            git_nodes=node_sources["git"],
             workflows=workflows,
             total_workflows=len(workflows),
             needs_model_downloads=any(m.needs_download for m in models),
@@ -164,13 +167,13 @@ class ImportAnalyzer:
                 if model_hash:
                     hash_to_workflows.setdefault(model_hash, []).append(workflow_name)
 
+        # Check local availability of every model in one lookup
+        local_models = self.model_repository.get_models_by_hashes(global_models)
+
         # Analyze each model
         for model_hash, model_data in global_models.items():
             sources = model_data.get("sources", [])
-
-            # Check local availability
-            existing = self.model_repository.get_model(model_hash)
-            locally_available = existing is not None
+            locally_available = model_hash in local_models
 
             models.append(ModelAnalysis(
                 filename=model_data.get("filename", "unknown"),
@@ -207,12 +210,12 @@ class ImportAnalyzer:
         workflows_config = pyproject_data.get("tool", {}).get("comfygit", {}).get("workflows", {})
 
         for workflow_name, workflow_data in workflows_config.items():
-            models = workflow_data.get("models", [])
+            criticality = Counter(m.get("criticality") for m in workflow_data.get("models", []))
 
             workflows.append(WorkflowAnalysis(
                 name=workflow_name,
-                models_required=sum(1 for m in models if m.get("criticality") == "required"),
-                models_optional=sum(1 for m in models if m.get("criticality") == "optional"),
+                models_required=criticality["required"],
+                models_optional=criticality["optional"],
             ))
 
         return workflows
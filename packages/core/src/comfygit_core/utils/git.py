@@ -604,6 +604,25 @@ def get_staged_changes(repo_path: Path) -> list[str]:
     return []
 
 
+def git_has_uncommitted_changes(repo_path: Path) -> bool:
+    """Check for uncommitted changes (staged, unstaged or untracked).
+
+    Cheaper than get_uncommitted_changes() when only a yes/no answer is
+    needed: the porcelain output is not parsed into file names.
+
+    Args:
+        repo_path: Path to the git repository
+
+    Returns:
+        True if git status reports any changes
+
+    Raises:
+        OSError: If git command fails
+    """
+    result = _git(["status", "--porcelain"], repo_path)
+    return bool(result.stdout.strip())
+
+
 def get_uncommitted_changes(repo_path: Path) -> list[str]:
     """Get list of files that have uncommitted changes (staged or unstaged).
 
@@ -312,3 +312,28 @@ class TestCoreLayerCommitAPI:
         # Should return False
         assert not test_env.has_committable_changes(), \
             "Should return False when no changes at all"
+
+    def test_commit_checks_reuse_sync_status(self, test_env):
+        """Test a provided sync status is used instead of re-scanning."""
+        workflow_data = {"nodes": [{"id": "1", "type": "Test"}], "links": []}
+        simulate_comfyui_save_workflow(test_env, "test", workflow_data)
+        sync_status = test_env.workflow_manager.get_workflow_sync_status()
+
+        with patch.object(test_env.workflow_manager, 'get_workflow_sync_status') as mock_sync:
+            assert test_env.has_committable_changes(sync_status)
+            workflow_status = test_env.workflow_manager.get_workflow_status(sync_status)
+            mock_sync.assert_not_called()
+
+        assert workflow_status.sync_status is sync_status
+        assert [wf.name for wf in workflow_status.analyzed_workflows] == ["test"]
+
+    def test_reset_pyproject_discards_uncommitted_changes(self, test_env):
+        """Test reset_pyproject restores pyproject.toml from HEAD."""
+        test_env.git_manager.commit_all("v1: Initial")
+        test_env.add_constraint("numpy<2.0")
+        assert test_env.git_manager.has_uncommitted_changes()
+
+        test_env.reset_pyproject()
+
+        assert not test_env.git_manager.has_uncommitted_changes()
+        assert "numpy<2.0" not in test_env.pyproject.uv_config.get_constraints()
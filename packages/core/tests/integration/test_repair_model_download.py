@@ -178,3 +178,29 @@ class TestRepairModelDownload:
         assert len(missing.workflow_names) == 2, "Should track both workflows"
         assert "workflow1" in missing.workflow_names
         assert "workflow2" in missing.workflow_names
+
+    def test_detect_missing_models_uses_one_bulk_lookup(self, test_env, test_workspace):
+        """All referenced hashes are resolved against the index in one bulk call."""
+        from unittest.mock import patch
+
+        builder = ModelIndexBuilder(test_workspace)
+        builder.add_model(
+            filename="shared_model.safetensors",
+            relative_path="checkpoints",
+            size_mb=4,
+            category="checkpoints"
+        )
+        builder.index_all()
+
+        for name in ("workflow1", "workflow2"):
+            workflow = WorkflowBuilder().add_checkpoint_loader("shared_model.safetensors").build()
+            simulate_comfyui_save_workflow(test_env, name, workflow)
+            test_env.resolve_workflow(name=name, fix=True)
+
+        repo = test_env.model_repository
+        with patch.object(repo, 'get_model', wraps=repo.get_model) as mock_get_model, \
+                patch.object(repo, 'get_models_by_hashes', wraps=repo.get_models_by_hashes) as mock_bulk:
+            assert test_env.detect_missing_models() == []
+
+        mock_bulk.assert_called_once()
+        mock_get_model.assert_not_called()
@@ -246,3 +246,49 @@ def test_repair_creates_download_intent_for_missing_models(test_env):
     assert workflow_models[0].status == "unresolved"
     assert workflow_models[0].hash is None
     assert workflow_models[0].sources == ["https://example.com/missing.safetensors"]
+
+
+def test_prepare_import_looks_up_shared_model_once(test_env):
+    """A model used by several workflows is checked against the index once."""
+    from unittest.mock import patch
+
+    fake_hash = "abc123def456"
+    model_entry = {
+        "filename": "missing.safetensors",
+        "hash": fake_hash,
+        "status": "resolved",
+        "criticality": "flexible",
+        "category": "checkpoints",
+        "nodes": [
+            {
+                "node_id": "1",
+                "node_type": "CheckpointLoaderSimple",
+                "widget_idx": 0,
+                "widget_value": "missing.safetensors"
+            }
+        ]
+    }
+    config = test_env.pyproject.load()
+    config["tool"]["comfygit"]["models"] = {
+        fake_hash: {
+            "filename": "missing.safetensors",
+            "hash": fake_hash,
+            "size": 4 * 1024 * 1024,  # 4MB
+            "relative_path": "checkpoints/missing.safetensors",
+            "category": "checkpoints",
+            "sources": ["https://example.com/missing.safetensors"]
+        }
+    }
+    config["tool"]["comfygit"]["workflows"] = {
+        "workflow_a": {"models": [dict(model_entry)]},
+        "workflow_b": {"models": [dict(model_entry)]},
+    }
+    test_env.pyproject.save(config)
+
+    with patch.object(
+        test_env.model_repository, "get_model", wraps=test_env.model_repository.get_model
+    ) as mock_get_model:
+        workflows_with_intents = test_env.prepare_import_with_model_strategy(strategy="all")
+
+    mock_get_model.assert_called_once_with(fake_hash)
+    assert sorted(workflows_with_intents) == ["workflow_a", "workflow_b"]
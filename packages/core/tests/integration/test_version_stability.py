@@ -150,6 +150,21 @@ class TestVersionStability:
         assert len(history_with_limit) >= 15, \
             f"Should show all commits despite limit=5, got {len(history_with_limit)}"
 
+    def test_newest_first_matches_chronological_labels(self, test_env):
+        """newest_first returns the same versions in reverse order."""
+        pyproject_path = test_env.cec_path / "pyproject.toml"
+
+        for i in range(1, 4):
+            with open(pyproject_path, 'a') as f:
+                f.write(f"\n# Order test {i}")
+            test_env.git_manager.commit_with_identity(f"Commit {i}")
+
+        chronological = test_env.git_manager.get_version_history(limit=100)
+        newest_first = test_env.git_manager.get_version_history(limit=100, newest_first=True)
+
+        assert newest_first == chronological[::-1]
+        assert newest_first[0]['message'] == "Commit 3"
+
 
 class TestVersionNumberFormat:
     """Test that version numbers follow the correct format."""
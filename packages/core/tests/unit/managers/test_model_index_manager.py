@@ -47,6 +47,64 @@ def test_add_and_find_models(tmp_path):
     assert len(all_models) == 2
 
 
+def test_find_model_by_hash_matches_any_hash_prefix(tmp_path):
+    """Test prefix lookup covers short, blake3 and sha256 hashes."""
+    index_mgr = ModelRepository(tmp_path / "test_prefix.db", current_directory=tmp_path)
+
+    index_mgr.ensure_model("aa11bb22cc33dd44", 1000, blake3_hash="ff00" * 16)
+    index_mgr.update_sha256("aa11bb22cc33dd44", "0123" * 16)
+    index_mgr.ensure_model("aa11bb2299999999", 1000)
+    index_mgr.add_location("aa11bb22cc33dd44", tmp_path, "checkpoints/a.safetensors", "a.safetensors", time.time())
+    index_mgr.add_location("aa11bb2299999999", tmp_path, "checkpoints/b.safetensors", "b.safetensors", time.time())
+
+    assert len(index_mgr.find_model_by_hash("aa11bb22")) == 2
+    assert [m.filename for m in index_mgr.find_model_by_hash("aa11bb22cc")] == ["a.safetensors"]
+    assert [m.filename for m in index_mgr.find_model_by_hash("ff00ff00")] == ["a.safetensors"]
+    assert [m.filename for m in index_mgr.find_model_by_hash("01230123")] == ["a.safetensors"]
+    assert [m.filename for m in index_mgr.find_model_by_hash("AA11BB22CC")] == ["a.safetensors"]
+    assert index_mgr.find_model_by_hash("aa11bc") == []
+
+
+def test_get_models_by_hashes(tmp_path):
+    """Test bulk lookup returns indexed models keyed by exact hash."""
+    db_path = tmp_path / "test_bulk.db"
+    base_path = tmp_path / "models"
+    other_path = tmp_path / "other_models"
+    base_path.mkdir()
+    index_mgr = ModelRepository(db_path, current_directory=base_path)
+
+    index_mgr.ensure_model("hash1", 1000)
+    index_mgr.ensure_model("hash2", 2000)
+    index_mgr.ensure_model("hash3", 3000)
+    index_mgr.add_location("hash1", base_path, "checkpoints/b.safetensors", "b.safetensors", time.time())
+    index_mgr.add_location("hash1", base_path, "checkpoints/a.safetensors", "a.safetensors", time.time())
+    index_mgr.add_location("hash2", base_path, "loras/c.safetensors", "c.safetensors", time.time())
+    # Only indexed under a different models directory
+    index_mgr.add_location("hash3", other_path, "loras/d.safetensors", "d.safetensors", time.time())
+
+    found = index_mgr.get_models_by_hashes(["hash1", "hash2", "hash3", "hash1", "missing", None])
+
+    assert set(found) == {"hash1", "hash2"}
+    assert found["hash1"].filename == index_mgr.get_model("hash1").filename == "a.safetensors"
+    assert found["hash2"].file_size == 2000
+    assert index_mgr.get_models_by_hashes([]) == {}
+
+
+def test_get_sources_by_hashes(tmp_path):
+    """Test bulk source lookup matches per-model get_sources()."""
+    index_mgr = ModelRepository(tmp_path / "test_sources.db", current_directory=tmp_path)
+
+    index_mgr.ensure_model("hash1", 1000)
+    index_mgr.ensure_model("hash2", 2000)
+    index_mgr.add_source("hash1", "civitai", "https://civitai.com/models/1")
+    index_mgr.add_source("hash1", "huggingface", "https://huggingface.co/a/b/resolve/main/c.safetensors")
+
+    sources = index_mgr.get_sources_by_hashes(["hash1", "hash2"])
+
+    assert set(sources) == {"hash1"}
+    assert sources["hash1"] == index_mgr.get_sources("hash1")
+
+
 def test_models_by_path_and_stats(tmp_path):
     """Test filtering models by path pattern and getting statistics."""
     db_path = tmp_path / "test_types.db"
@@ -193,3 +251,22 @@ def test_workflow_search_with_path_separators(tmp_path):
     search_results = index_mgr.search("v1-5")
     assert len(search_results) >= 1
     assert any("v1-5" in m.filename for m in search_results)
+
+
+def test_schema_created_once_and_migrated_when_outdated(tmp_path):
+    """Test reopening a current database skips setup but old versions still migrate."""
+    from comfygit_core.repositories.model_repository import SCHEMA_VERSION
+
+    db_path = tmp_path / "test_schema.db"
+    index_mgr = ModelRepository(db_path)
+    index_mgr.ensure_model("hash1", 1000)
+    assert index_mgr.get_schema_version() == SCHEMA_VERSION
+
+    # Current schema: data survives reopening
+    assert ModelRepository(db_path).has_model("hash1")
+
+    # Outdated schema: reopening rebuilds the database
+    index_mgr.sqlite.execute_write("UPDATE schema_info SET version = ?", (SCHEMA_VERSION - 1,))
+    reopened = ModelRepository(db_path)
+    assert reopened.get_schema_version() == SCHEMA_VERSION
+    assert not reopened.has_model("hash1")
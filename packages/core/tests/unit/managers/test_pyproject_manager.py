@@ -197,6 +197,39 @@ class TestNodeHandlerFormatting:
         assert "[tool.comfygit.nodes]" not in content
 
 
+class TestDependencyGroupDeduplication:
+    """Test that adding packages to a dependency group skips duplicates."""
+
+    def test_add_to_group_skips_existing_and_repeated(self, temp_pyproject):
+        """Test packages already in the group or repeated in the batch are added once."""
+        manager = PyprojectManager(temp_pyproject)
+
+        manager.dependencies.add_to_group("test-group", ["torch", "numpy"])
+        manager.dependencies.add_to_group("test-group", ["numpy", "pillow", "pillow"])
+
+        config = manager.load(force_reload=True)
+        assert list(config["dependency-groups"]["test-group"]) == ["torch", "numpy", "pillow"]
+
+
+class TestConstraintBatching:
+    """Test that constraint changes can share one in-memory config."""
+
+    def test_batched_constraints_written_once(self, temp_pyproject):
+        """Test batched add/remove only touch disk when the caller saves."""
+        manager = PyprojectManager(temp_pyproject)
+
+        config = manager.load()
+        manager.uv_config.add_constraint("torch==2.4.1", config=config)
+        manager.uv_config.add_constraint("numpy<2.0", config=config)
+        assert manager.uv_config.remove_constraint("torch", config=config)
+        assert not manager.uv_config.remove_constraint("pillow", config=config)
+
+        assert "constraint-dependencies" not in temp_pyproject.read_text()
+
+        manager.save(config)
+        assert manager.uv_config.get_constraints() == ["numpy<2.0"]
+
+
 class TestWorkflowModelDeduplication:
     """Test that workflow model entries don't duplicate when resolving to different filenames."""
 
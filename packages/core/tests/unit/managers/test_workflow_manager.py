@@ -141,9 +141,9 @@ def test_apply_resolution_preserves_existing_sources(workflow_manager):
     workflow_manager.pyproject.workflows.remove_workflows = Mock(return_value=0)
     workflow_manager.pyproject.load = Mock(return_value={'tool': {'comfygit': {'workflows': {'test_workflow': {}}}}})
     workflow_manager.update_workflow_model_paths = Mock()
-    workflow_manager.model_repository.get_sources = Mock(return_value=[
+    workflow_manager.model_repository.get_sources_by_hashes = Mock(return_value={existing_hash: [
         {'url': 'https://civitai.com/model/123', 'type': 'civitai', 'metadata': {}, 'added_time': 0}
-    ])
+    ]})
 
     # Create resolution result with a resolved model
     model_with_location = ModelWithLocation(
@@ -205,7 +205,7 @@ def test_apply_resolution_empty_sources_for_new_models(workflow_manager):
     workflow_manager.pyproject.workflows.remove_workflows = Mock(return_value=0)
     workflow_manager.pyproject.load = Mock(return_value={'tool': {'comfygit': {'workflows': {'test_workflow': {}}}}})
     workflow_manager.update_workflow_model_paths = Mock()
-    workflow_manager.model_repository.get_sources = Mock(return_value=[])
+    workflow_manager.model_repository.get_sources_by_hashes = Mock(return_value={})
 
     # Create resolution result
     model_with_location = ModelWithLocation(
@@ -544,7 +544,7 @@ class TestOptionalUnresolvedModelPersistence:
         workflow_manager.pyproject.load = Mock(return_value={'tool': {'comfygit': {'workflows': {'test': {}}}}})
         workflow_manager.pyproject.models.add_model = Mock()
         workflow_manager.pyproject.models.cleanup_orphans = Mock()
-        workflow_manager.model_repository.get_sources = Mock(return_value=[])
+        workflow_manager.model_repository.get_sources_by_hashes = Mock(return_value={})
 
         with patch.object(workflow_manager.model_resolver, 'model_config') as mock_config:
             mock_config.get_directories_for_node.return_value = []
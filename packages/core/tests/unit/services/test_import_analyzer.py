@@ -70,11 +70,9 @@ def mock_model_repository():
         def __init__(self):
             self.available_models = {"ghi789"}  # Only model3 is available locally
 
-        def get_model(self, hash):
-            """Return model if it exists in available set."""
-            if hash in self.available_models:
-                return {"hash": hash}
-            return None
+        def get_models_by_hashes(self, hashes):
+            """Return the requested models that exist in the available set."""
+            return {h: {"hash": h} for h in hashes if h in self.available_models}
 
     return MockModelRepository()
 
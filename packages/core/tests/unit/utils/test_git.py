@@ -1,6 +1,12 @@
 """Unit tests for git utility functions."""
 import pytest
-from comfygit_core.utils.git import parse_git_url_with_subdir, git_clone_subdirectory
+from comfygit_core.utils.git import (
+    get_uncommitted_changes,
+    git_clone_subdirectory,
+    git_has_uncommitted_changes,
+    git_init,
+    parse_git_url_with_subdir,
+)
 from pathlib import Path
 
 
@@ -60,3 +66,17 @@ class TestGitCloneSubdirectory:
                 target_path=tmp_path / "target",
                 subdir="examples/invalid"
             )
+
+
+class TestGitHasUncommittedChanges:
+    """Test the boolean uncommitted-changes probe."""
+
+    def test_agrees_with_file_listing(self, tmp_path):
+        """Clean and dirty states match get_uncommitted_changes()."""
+        git_init(tmp_path)
+        assert not git_has_uncommitted_changes(tmp_path)
+        assert get_uncommitted_changes(tmp_path) == []
+
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+        assert git_has_uncommitted_changes(tmp_path)
+        assert get_uncommitted_changes(tmp_path) == ["pyproject.toml"]